@@ -1,21 +1,140 @@
 #!/usr/bin/env python3
 """
 Utility functions for art-related operations.
+Art can come from a directory of text files (optionally described by a
+manifest.json) or from a single zlib-compressed .pack file. Frames are
+read lazily and kept in a bounded LRU cache.
 """
 
+import json
+import struct
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+
+MANIFEST_NAME = "manifest.json"
+PACK_MAGIC = b"RRPACK1\n"
+DEFAULT_FRAMES = {"Alive": "Alive.txt", "Dead": "Dead.txt"}
+DEFAULT_ANIMATION = ["Alive", "Dead"]
+DEFAULT_CACHE_SIZE = 32
+
+
 class Art:
-    """Class to load and store ASCII art from text files."""
-    def __init__(self, directory: str):
+    """Class to load and store ASCII art from text files or an art pack."""
+    def __init__(self, directory: str, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.path = Path(directory)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._pack_index = None
+
+        try:
+            if self.path.is_file():
+                self._open_pack()
+            else:
+                self._read_manifest()
+        except Exception as e:
+            print(f"Error loading art manifest: {e}")
+            self.frames = dict(DEFAULT_FRAMES)
+            self.animation = list(DEFAULT_ANIMATION)
+
+    def _read_manifest(self):
+        """
+        manifest.json looks like:
+            {"frames": {"Alive": "Alive.txt", ...}, "animation": ["Alive", ...]}
+        Without a manifest the classic Alive.txt / Dead.txt pair is used.
+        """
+        manifest_path = self.path / MANIFEST_NAME
+        if manifest_path.exists():
+            manifest = json.loads(manifest_path.read_text())
+            self.frames = dict(manifest["frames"])
+            self.animation = list(manifest.get("animation", self.frames))
+        else:
+            self.frames = dict(DEFAULT_FRAMES)
+            self.animation = list(DEFAULT_ANIMATION)
+
+    def _open_pack(self):
+        """Read only the pack header; frame bodies stay on disk until needed"""
+        with open(self.path, 'rb') as file:
+            if file.read(len(PACK_MAGIC)) != PACK_MAGIC:
+                raise ValueError(f"{self.path} is not an art pack")
+            (header_size,) = struct.unpack("<I", file.read(4))
+            header = json.loads(file.read(header_size))
+        data_start = len(PACK_MAGIC) + 4 + header_size
+        self._pack_index = {
+            name: (data_start + offset, size)
+            for name, (offset, size) in header["frames"].items()
+        }
+        self.frames = {name: name for name in self._pack_index}
+        self.animation = list(header.get("animation", self.frames))
+
+    def _load(self, name):
+        if self._pack_index is not None:
+            offset, size = self._pack_index[name]
+            with open(self.path, 'rb') as file:
+                file.seek(offset)
+                return zlib.decompress(file.read(size)).decode()
+        with open(self.path / self.frames[name], 'r') as file:
+            return file.read()
+
+    def frame(self, name):
+        """Return a frame by name, loading it on first use"""
+        if name in self._cache:
+            self._cache.move_to_end(name)
+            return self._cache[name]
+
         try:
-            with open(directory + "/Alive.txt", 'r') as file:
-                self.Alive = file.read()
-            with open(directory + "/Dead.txt", 'r') as file:
-                self.Dead = file.read()
-        except FileNotFoundError as e:
+            text = self._load(name)
+        except (FileNotFoundError, KeyError) as e:
             print(f"Error loading art files: {e}")
-            self.Alive = ""
-            self.Dead = ""
+            text = ""
         except Exception as e:
             print(f"An unexpected error occurred: {e}")
-            self.Alive = ""
-            self.Dead = ""
\ No newline at end of file
+            text = ""
+
+        self._cache[name] = text
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return text
+
+    def animation_frames(self):
+        """All frames of the animation, in order"""
+        return [self.frame(name) for name in self.animation]
+
+    @property
+    def Alive(self):
+        return self.frame("Alive")
+
+    @property
+    def Dead(self):
+        return self.frame("Dead")
+
+
+def build_pack(directory: str, output: str, level: int = 9):
+    """Compress an art directory (and its manifest) into a single .pack file"""
+    art = Art(directory)
+    blobs = []
+    index = {}
+    offset = 0
+    for name in art.frames:
+        blob = zlib.compress(art.frame(name).encode(), level)
+        index[name] = [offset, len(blob)]
+        blobs.append(blob)
+        offset += len(blob)
+
+    header = json.dumps({"frames": index, "animation": art.animation}).encode()
+    with open(output, 'wb') as file:
+        file.write(PACK_MAGIC)
+        file.write(struct.pack("<I", len(header)))
+        file.write(header)
+        for blob in blobs:
+            file.write(blob)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 3:
+        print("Usage: python3 art_utils.py <art directory> <output.pack>")
+        sys.exit(1)
+    build_pack(sys.argv[1], sys.argv[2])
+    print(f"Art pack written to {sys.argv[2]}")
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Resolved file locations for the game.
+Everything OS-dependent is worked out once, in one place, and nothing is
+created on disk until a player or lives manager actually needs it.
+"""
+
+import os
+import platform
+from functools import lru_cache
+from pathlib import Path
+
+
+class Paths:
+    """All paths the game uses, resolved for one OS"""
+    def __init__(self, system=None, lives_folder="./lives", art_dir="./Art/"):
+        self.system = system or platform.system()
+        self.lives_folder = Path(lives_folder)
+        self.art_dir = art_dir
+
+        if self.system == "Windows":
+            base_path = Path(os.getenv('LOCALAPPDATA', os.path.expanduser('~')))
+            self.config_dir = base_path / '.roulette'
+            self.hardcore_config_dir = base_path / '.roulette_hardcore'
+            self.sacrifice_dir = Path("C:/Windows/System32")
+        else:  # Linux, macOS, etc.
+            self.config_dir = Path.home() / '.config' / 'roulette'
+            self.hardcore_config_dir = Path.home() / '.config' / 'roulette_hardcore'
+            self.sacrifice_dir = Path("/")
+
+        self.death_marker = self.config_dir / '.death_marker'
+        self.first_run_marker = self.config_dir / '.first_run_complete'
+        self.journal = self.config_dir / 'rounds.journal'
+        self.hardcore_death_marker = self.hardcore_config_dir / '.death_marker'
+        self.sacrifice_log = self.hardcore_config_dir / 'sacrifices.log'
+        self.hardcore_journal = self.hardcore_config_dir / 'rounds.journal'
+
+
+@lru_cache(maxsize=None)
+def get_paths():
+    """The process-wide Paths, resolved on first use"""
+    return Paths()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Crash-safe writes for game state.
+atomic_write() replaces a file via temp-file + fsync + rename, so readers
+never see a torn file. GroupCommitWriter batches concurrent appends and
+replacements into one fsync per file per commit window (group commit).
+"""
+
+import atexit
+import os
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+
+DEFAULT_MAX_LATENCY = 0.005  # seconds a write may wait for others to join its batch
+
+
+def _fsync_dir(directory):
+    """Make a rename in directory durable (no-op where dirs can't be opened)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_temp(path, data):
+    temp_file = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(temp_file, 'w') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    return temp_file
+
+
+def atomic_write(path, data, sync_dir=True):
+    """Replace path with data atomically and durably"""
+    path = Path(path)
+    temp_file = _write_temp(path, data)
+    os.replace(temp_file, path)
+    if sync_dir:
+        _fsync_dir(path.parent)
+
+
+class _Request:
+    __slots__ = ("kind", "path", "data", "done", "error")
+
+    def __init__(self, kind, path, data):
+        self.kind = kind
+        self.path = Path(path) if path is not None else None
+        self.data = data
+        self.done = threading.Event()
+        self.error = None
+
+
+class GroupCommitWriter:
+    """
+    Background writer that commits queued writes in batches.
+    A batch closes max_latency seconds after its first write arrives; all
+    appends to one file in the batch share a single open and fsync, and
+    replacements of the same file collapse to the last one.
+    """
+    def __init__(self, max_latency=DEFAULT_MAX_LATENCY):
+        self.max_latency = max_latency
+        self.commits = 0
+        self._queue = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="group-commit", daemon=True)
+        self._thread.start()
+
+    def _submit(self, request, wait):
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("GroupCommitWriter is closed")
+            self._queue.append(request)
+            self._cond.notify()
+        if wait:
+            request.done.wait()
+            if request.error is not None:
+                raise request.error
+        return request.done
+
+    def append(self, path, text, wait=True):
+        """Append text to path; with wait=True, return once it is on disk"""
+        return self._submit(_Request("append", path, text), wait)
+
+    def replace(self, path, text, wait=True):
+        """Atomically replace path with text"""
+        return self._submit(_Request("replace", path, text), wait)
+
+    def flush(self):
+        """Block until everything queued so far is committed"""
+        self._submit(_Request("barrier", None, None), wait=True)
+
+    def close(self):
+        """Commit whatever is still queued and stop the writer thread"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue:
+                    if self._closed:
+                        return
+                    self._cond.wait()
+                # Hold the batch open so concurrent writers can join it
+                deadline = time.monotonic() + self.max_latency
+                while not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch, self._queue = self._queue, []
+            self._commit(batch)
+
+    def _commit(self, batch):
+        appends = {}   # path -> [requests], in arrival order
+        replaces = {}  # path -> [requests]; only the last one is written
+        for request in batch:
+            if request.kind == "append":
+                appends.setdefault(request.path, []).append(request)
+            elif request.kind == "replace":
+                replaces.setdefault(request.path, []).append(request)
+
+        try:
+            dirs = set()
+            for path, requests in appends.items():
+                self._apply(self._append_all, path, requests)
+            for path, requests in replaces.items():
+                if self._apply(self._replace_last, path, requests):
+                    dirs.add(path.parent)
+            for directory in dirs:
+                _fsync_dir(directory)
+            self.commits += 1
+        finally:
+            # Never leave a caller blocked, whatever went wrong in the batch
+            for request in batch:
+                request.done.set()
+
+    @staticmethod
+    def _apply(action, path, requests):
+        try:
+            action(path, requests)
+            return True
+        except Exception as e:  # e.g. UnicodeEncodeError for an unencodable file name
+            for request in requests:
+                request.error = e
+            return False
+
+    @staticmethod
+    def _append_all(path, requests):
+        with open(path, 'a') as f:
+            f.write("".join(request.data for request in requests))
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def _replace_last(path, requests):
+        temp_file = _write_temp(path, requests[-1].data)
+        os.replace(temp_file, path)
+
+
+@lru_cache(maxsize=None)
+def get_writer():
+    """Process-wide group-commit writer, started on first use"""
+    writer = GroupCommitWriter()
+    atexit.register(writer.close)
+    return writer
@@ -1,18 +1,14 @@
-from pathlib import Path
-import os, platform
+import os
+from config_utils import get_paths
 
 """ If you wish to revive yourself, you must go through the holy trial of finding the death marker file. """
 
-if platform.system() == "Windows":
-    base = Path(os.getenv('LOCALAPPDATA', os.path.expanduser('~')))
-    config_dir = base / '.roulette'
-else:
-    config_dir = Path.home() / '.config' / 'roulette'
-
-path = config_dir / '.death_marker'
+paths = get_paths()
+config_dir = paths.config_dir
+path = paths.death_marker
 
 print("LOCALAPPDATA:", os.getenv('LOCALAPPDATA'))
-print("Base Path:", base)
+print("Base Path:", config_dir.parent)
 print("Config Dir:", config_dir)
 print("Death File:", path)
 print("Resolved:", path.resolve())
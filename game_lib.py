@@ -5,39 +5,45 @@ Includes both normal and hardcore mode functionality.
 """
 
 import os
-import platform
 import random
 import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from art_utils import Art
+from config_utils import get_paths
+from durable_utils import get_writer
+from game_session import GameSession, FIRED, JAM, DUD, REVIVED, DEAD
+from journal import RoundJournal
+from lives_utils import LivesIndex, LivesLedger
 from player_utils import Player, HardcorePlayer
-
-player = Player()
-hardcore_player = HardcorePlayer()
-
+from renderer import get_renderer
+from rules import CHAMBERS, NORMAL_RULES, HARDCORE_RULES
 
 class LivesManager:
-    def __init__(self, lives_folder="./lives"):
-        self.lives_folder = Path(lives_folder)
+    def __init__(self, lives_folder=None, ledger_path=None, paths=None):
+        paths = paths or get_paths()
+        self.lives_folder = Path(lives_folder) if lives_folder else paths.lives_folder
         self.debug_mode = False  # Debug mode toggle
         
-        # Get config directory based on OS (same location as death marker)
-        if platform.system() == "Windows":
-            base_path = Path(os.getenv('LOCALAPPDATA', os.path.expanduser('~')))
-            self.config_dir = base_path / '.roulette'
-        else:  # Linux, macOS, etc.
-            self.config_dir = Path.home() / '.config' / 'roulette'
+        # Config directory is the same location as the death marker
+        self.config_dir = paths.config_dir
+        self.first_run_marker = paths.first_run_marker
         
         # Create config directory if it doesn't exist
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
         # Path to death marker file
-        self.death_marker = self.config_dir / '.death_marker'
+        self.death_marker = paths.death_marker
         
         # Create lives folder if it doesn't exist
         self.lives_folder.mkdir(exist_ok=True)
         
+        # Cached view of the lives folder, rescanned only when it changes
+        self.index = LivesIndex(self.lives_folder)
+        
+        # Optional compact ledger instead of one file per life
+        self.ledger = LivesLedger(ledger_path) if ledger_path else None
+        
         # Generate initial life file if folder is empty
         self._generate_initial_life()
     
@@ -47,7 +53,7 @@ class LivesManager:
         existing_files = list(self.lives_folder.iterdir()) if self.lives_folder.exists() else []
         
         # Check if a "first run" marker exists in config directory
-        first_run_marker = self.config_dir / ".first_run_complete"
+        first_run_marker = self.first_run_marker
         
         # Only create starter life if:
         # 1. Folder is empty (no files)
@@ -55,8 +61,11 @@ class LivesManager:
         if len(existing_files) == 0 and not first_run_marker.exists():
             initial_life = self.lives_folder / "starter_life.txt"
             
-            # Create the file
-            initial_life.write_text("Your first life. Good luck.")
+            # Create the file (or its ledger entry)
+            if self.ledger is not None:
+                self.ledger.grant(1, source=initial_life.name)
+            else:
+                initial_life.write_text("Your first life. Good luck.")
             
             # Create first run marker so we don't generate lives again
             first_run_marker.touch()
@@ -65,21 +74,26 @@ class LivesManager:
     
     def _get_cutoff_date(self):
         """Get the cutoff date for valid lives (death time or current time)"""
-        if self.death_marker.exists():
+        try:
             # Use death marker file's creation time as cutoff
-            return self.death_marker.stat().st_mtime
-        else:
+            return os.stat(self.death_marker).st_mtime
+        except FileNotFoundError:
             # If not dead, use current time (all existing files are valid)
             return time.time()
     
     def get_valid_lives(self, show_debug=None):
         """Get list of valid life files (modified before cutoff date)"""
-        if not self.lives_folder.exists():
-            return []
-        
         # Get cutoff date based on death time
         cutoff_date = self._get_cutoff_date()
         
+        if self.ledger is not None:
+            # One entry per life, oldest first
+            return [source for _, remaining, source in self.ledger.valid_at(cutoff_date)
+                    for _ in range(remaining)]
+        
+        if not self.lives_folder.exists():
+            return []
+        
         # If show_debug is explicitly False, don't show debug
         # If show_debug is None, use self.debug_mode
         # If show_debug is True, always show debug
@@ -90,74 +104,99 @@ class LivesManager:
         else:
             should_debug = self.debug_mode
         
-        valid_lives = []
-        for file_path in self.lives_folder.iterdir():
-            if file_path.is_file():
-                mod_time = file_path.stat().st_mtime  # Use modification 
-                
-                # Only show debug output if debug mode is enabled
-                if should_debug:
-                    print(f"DEBUG: Checking {file_path.name}")
-                    print(f"  Modified time: {mod_time}")
-                    print(f"  Cutoff time: {cutoff_date}")
-                    print(f"  Valid: {mod_time < cutoff_date}")
-                
-                if mod_time < cutoff_date:
-                    valid_lives.append(file_path)
+        if should_debug:
+            for mod_time, file_path in self.index.entries():
+                print(f"DEBUG: Checking {file_path.name}")
+                print(f"  Modified time: {mod_time}")
+                print(f"  Cutoff time: {cutoff_date}")
+                print(f"  Valid: {mod_time < cutoff_date}")
         
-        return sorted(valid_lives, key=lambda x: x.stat().st_mtime)
+        return self.index.valid(cutoff_date)
     
-    def count_lives(self):
+    def count_lives(self, show_debug=None):
         """Count number of valid lives remaining"""
-        return len(self.get_valid_lives())
+        if self.ledger is not None:
+            return self.ledger.count_valid_at(self._get_cutoff_date())
+        if self.debug_mode if show_debug is None else show_debug:
+            return len(self.get_valid_lives(show_debug=True))
+        return self.index.count(self._get_cutoff_date())
     
     def consume_life(self):
         """Use up one life (delete oldest valid life file)"""
-        valid_lives = self.get_valid_lives()
+        if self.ledger is not None:
+            return self.consume_lives(1) == 1
         
-        if not valid_lives:
-            return False
+        if self.debug_mode:
+            self.get_valid_lives()
         
-        # Delete the oldest life file
-        oldest_life = valid_lives[0]
         try:
-            oldest_life.unlink()
+            # Claim the oldest life file so no other game process can use it
+            claim = self.index.claim_oldest(self._get_cutoff_date())
+            if claim is None:
+                return False
+            
+            # Delete the claimed life file
+            oldest_life, claimed_life = claim
+            self.index.release_claim(claimed_life)
             print(f"\n💚 EXTRA LIFE CONSUMED!")
             print(f"   Used: {oldest_life.name}")
             print(f"   Lives remaining: {self.count_lives()}")
             return True
         except Exception as e:
+            self.index.invalidate()
             print(f"Error consuming life: {e}")
             return False
     
     def has_lives(self):
         """Check if player has any lives remaining"""
         return self.count_lives() > 0
+    
+    def grant_lives(self, count=1):
+        """Bulk grant lives (ledger backend only); negative counts raise ValueError"""
+        if self.ledger is None:
+            raise ValueError("Bulk grants need the ledger backend")
+        self.ledger.grant(count)
+    
+    def consume_lives(self, count):
+        """Bulk consume the oldest valid lives (ledger backend only); negative counts raise ValueError"""
+        if self.ledger is None:
+            raise ValueError("Bulk consumption needs the ledger backend")
+        used = self.ledger.consume(count, self._get_cutoff_date())
+        if used:
+            print(f"\n💚 EXTRA LIFE CONSUMED!" if len(used) == 1
+                  else f"\n💚 {len(used)} EXTRA LIVES CONSUMED!")
+            print(f"   Used: {used[0] or 'ledger life'}")
+            print(f"   Lives remaining: {self.count_lives()}")
+        return len(used)
+    
+    def import_life_files(self, remove=True):
+        """Move the existing life files of the lives folder into the ledger"""
+        if self.ledger is None:
+            raise ValueError("Importing life files needs the ledger backend")
+        imported = self.ledger.import_life_files(self.lives_folder, remove=remove)
+        self.index.invalidate()
+        return imported
 
 
 class HardcoreLivesManager:
     """Hardcore version - sacrifices real system files"""
-    def __init__(self):
+    counted = False  # count_lives() scans the system directory for "???"
+
+    def __init__(self, paths=None):
+        paths = paths or get_paths()
         self.debug_mode = False
+        self.system = paths.system
         
-        # Determine system file directory based on OS
-        if platform.system() == "Windows":
-            self.sacrifice_dir = Path("C:/Windows/System32")
-        else:  # Linux, macOS
-            self.sacrifice_dir = Path("/")
-        
-        # Get config directory for death marker
-        if platform.system() == "Windows":
-            base_path = Path(os.getenv('LOCALAPPDATA', os.path.expanduser('~')))
-            self.config_dir = base_path / '.roulette_hardcore'
-        else:
-            self.config_dir = Path.home() / '.config' / 'roulette_hardcore'
+        # System file directory (System32 on Windows, root elsewhere)
+        self.sacrifice_dir = paths.sacrifice_dir
         
+        # Config directory for death marker
+        self.config_dir = paths.hardcore_config_dir
         self.config_dir.mkdir(parents=True, exist_ok=True)
-        self.death_marker = self.config_dir / '.death_marker'
+        self.death_marker = paths.hardcore_death_marker
         
         # Log file for deleted files
-        self.sacrifice_log = self.config_dir / 'sacrifices.log'
+        self.sacrifice_log = paths.sacrifice_log
     
     def _get_random_system_file(self):
         """Get a random file from the system directory (not a folder)"""
@@ -165,7 +204,7 @@ class HardcoreLivesManager:
             all_files = []
             
             # For Windows System32
-            if platform.system() == "Windows":
+            if self.system == "Windows":
                 # Only scan System32 directory
                 for item in self.sacrifice_dir.iterdir():
                     if item.is_file():
@@ -215,9 +254,8 @@ class HardcoreLivesManager:
         
         try:
             # Log the sacrifice before deletion
-            with open(self.sacrifice_log, 'a') as log:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                log.write(f"{timestamp} | DELETED: {victim_file}\n")
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            get_writer().append(self.sacrifice_log, f"{timestamp} | DELETED: {victim_file}\n")
             
             # Attempt to delete the file
             victim_file.unlink()
@@ -244,141 +282,159 @@ class HardcoreLivesManager:
         return "???" if self.has_lives() else 0
 
 
-# Global instances
-lives_manager = LivesManager()
-hardcore_lives = HardcoreLivesManager()
+# Global instances, built on first use so importing game_lib has no side effects
+@lru_cache(maxsize=None)
+def get_player():
+    return Player()
+
+
+@lru_cache(maxsize=None)
+def get_hardcore_player():
+    return HardcorePlayer()
+
+
+@lru_cache(maxsize=None)
+def get_lives_manager():
+    return LivesManager()
+
+
+@lru_cache(maxsize=None)
+def get_hardcore_lives():
+    return HardcoreLivesManager()
 
 
 def clear_screen():
-    os.system('cls' if platform.system() == 'Windows' else 'clear')
+    get_renderer(get_paths().art_dir).clear_screen()
 
 
 def spin_cylinder():
     """Simulate spinning the revolver's cylinder with ASCII art"""
-    artwork = Art("./Art/")
-    frames = [artwork.Alive, artwork.Dead]
+    get_renderer(get_paths().art_dir).spin()
 
-    clear_screen()
-    print("\n You spin the cylinder...\n")
-    time.sleep(1)
-    
-    # Spin animation
-    for _ in range(len(frames) * 3):
-        for frame in frames:
-            print(frame)
-            time.sleep(0.08)
-            clear_screen()
-    
-    # Final position
-    print(frames[0])
-    time.sleep(0.3)
+
+def _print_pull_result(result, hardcore=False, chambers=CHAMBERS):
+    """Describe the outcome of a trigger pull"""
+    if result.outcome in (JAM, DUD):
+        if result.outcome == JAM:
+            print("*CLUNK* - THE GUN JAMMED!" if hardcore else "🔧 *CLUNK* - THE GUN JAMMED!")
+            print("Mechanical failure! The firing pin didn't strike!")
+        else:
+            print("*THUNK* - DUD ROUND!" if hardcore else "💨 *THUNK* - DUD ROUND!")
+            print("The primer failed to ignite! Faulty ammunition!")
+        print("\nYou survive by sheer luck!")
+        print("The cylinder rotates. The game continues...\n")
+        time.sleep(1.5)
+    elif result.outcome == REVIVED:
+        if hardcore:
+            print("\nYou've been revived through sacrifice!")
+        else:
+            print("\n🔄 You've been revived!")
+        print("The game continues...\n")
+        time.sleep(1.5)
+    elif result.outcome == DEAD:
+        print("\nGame Over. You can NEVER play again.")
+    else:
+        print("You survived this round!" if hardcore else "✓ You survived this round!")
+        print(f"Chamber {result.chamber}/{chambers} was empty.")
+
+
+def _play_round(game, hardcore=False):
+    """Drive one round of a GameSession from the terminal"""
+    if game.state == FIRED:
+        game.continue_()
+
+    input("Press ENTER to spin the cylinder...")
+    game.spin()
+
+    spin_cylinder()
+
+    print("\n" + "=" * 40)
+    input("Press ENTER to pull the trigger...")
+
+    print("\n*CLICK*\n")
+    time.sleep(0.5)
+
+    result = game.pull()
+    _print_pull_result(result, hardcore, game.rules.chambers)
+    return result.alive
+
+
+def _announce_bang(game):
+    print("💀 BANG! You're dead!")
+    if game.lives.has_lives():
+        time.sleep(1)
+
+
+def _announce_bang_hardcore(game):
+    print("BANG! You're dead!")
+    if game.lives.has_lives():
+        time.sleep(1)
+
+
+# Round history; one block per round so nothing is lost if the game is killed.
+# At that size the index has an entry per round (dense, not sparse), which is
+# fine for one player's history.
+@lru_cache(maxsize=None)
+def get_journal():
+    return RoundJournal(get_paths().journal, block_records=1)
+
+
+@lru_cache(maxsize=None)
+def get_hardcore_journal():
+    return RoundJournal(get_paths().hardcore_journal, block_records=1)
+
+
+# Game sessions driven by the CLI front ends
+@lru_cache(maxsize=None)
+def get_session():
+    return GameSession(get_lives_manager(), get_player(), NORMAL_RULES,
+                       on_bang=_announce_bang, journal=get_journal(),
+                       session_id=int(time.time()))
+
+
+@lru_cache(maxsize=None)
+def get_hardcore_session():
+    return GameSession(get_hardcore_lives(), get_hardcore_player(), HARDCORE_RULES,
+                       on_bang=_announce_bang_hardcore, journal=get_hardcore_journal(),
+                       session_id=int(time.time()), revive_player=True)
+
+
+_ACCESSORS = {
+    "player": get_player,
+    "hardcore_player": get_hardcore_player,
+    "lives_manager": get_lives_manager,
+    "hardcore_lives": get_hardcore_lives,
+    "journal": get_journal,
+    "hardcore_journal": get_hardcore_journal,
+    "session": get_session,
+    "hardcore_session": get_hardcore_session,
+}
+
+
+def __getattr__(name):
+    """Keep the old module-level instances (game_lib.player etc.) working, lazily"""
+    if name in _ACCESSORS:
+        return _ACCESSORS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def play_round():
     """Play one round of Russian Roulette with lives system"""
-    chamber = random.randint(1, 6)
-    
     print("\n Russian Roulette")
     print("=" * 40)
     # Force no debug output when just displaying lives count
-    lives_count = len(lives_manager.get_valid_lives(show_debug=False))
+    lives_count = get_lives_manager().count_lives(show_debug=False)
     if lives_count > 0:
         print(f"💚 Extra Lives: {lives_count}")
-    input("Press ENTER to spin the cylinder...")
-    
-    spin_cylinder()
-    
-    print("\n" + "=" * 40)
-    input("Press ENTER to pull the trigger...")
-    
-    print("\n*CLICK*\n")
-    time.sleep(0.5)
-    
-    if chamber == 1:  # 1 in 6 chance
-        # 33% chance of failure (jam or dud)
-        if random.random() < 0.33:
-            # 50-50 chance: gun jam or dud ammo
-            if random.random() < 0.5:
-                print("🔧 *CLUNK* - THE GUN JAMMED!")
-                print("Mechanical failure! The firing pin didn't strike!")
-            else:
-                print("💨 *THUNK* - DUD ROUND!")
-                print("The primer failed to ignite! Faulty ammunition!")
-            print("\nYou survive by sheer luck!")
-            print("The cylinder rotates. The game continues...\n")
-            time.sleep(1.5)
-            return True  # Survived
-        else:
-            print("💀 BANG! You're dead!")
-            
-            # Check for extra lives
-            if lives_manager.has_lives():
-                time.sleep(1)
-                if lives_manager.consume_life():
-                    print("\n🔄 You've been revived!")
-                    print("The game continues...\n")
-                    time.sleep(1.5)
-                    return True  # Continue playing
-            
-            # No lives left - permanent death
-            print("\nGame Over. You can NEVER play again.")
-            player.mark_dead()
-            return False
-    else:
-        print("✓ You survived this round!")
-        print(f"Chamber {chamber}/6 was empty.")
-        return True
+
+    return _play_round(get_session())
 
 
 def play_round_hardcore():
     """Play one round with hardcore revival system"""
-    chamber = random.randint(1, 6)
-    
-    print("\n Russian Roulette - HARDCORE MODE")
+    print("By playing you assume all liability for damages.")
+    print("\n 🔥Russian Roulette - HARDCORE MODE🔥")
     print("=" * 40)
-    print("System File Sacrifice: Available" if hardcore_lives.has_lives() else "No system files available")
-    input("Press ENTER to spin the cylinder...")
-    
-    spin_cylinder()
-    
-    print("\n" + "=" * 40)
-    input("Press ENTER to pull the trigger...")
-    
-    print("\n*CLICK*\n")
-    time.sleep(0.5)
-    
-    if chamber == 1:  # 1 in 6 chance
-        # 13% chance of failure (jam or dud)
-        if random.random() < 0.13:
-            # 50-50 chance: gun jam or dud ammo
-            if random.random() < 0.5:
-                print("*CLUNK* - THE GUN JAMMED!")
-                print("Mechanical failure! The firing pin didn't strike!")
-            else:
-                print("*THUNK* - DUD ROUND!")
-                print("The primer failed to ignite! Faulty ammunition!")
-            print("\nYou survive by sheer luck!")
-            print("The cylinder rotates. The game continues...\n")
-            time.sleep(1.5)
-            return True  # Survived
-        else:
-            print("BANG! You're dead!")
-            
-            # Check for hardcore revival
-            if hardcore_lives.has_lives():
-                time.sleep(1)
-                if hardcore_lives.consume_life():
-                    hardcore_player.revive()
-                    print("\nYou've been revived through sacrifice!")
-                    print("The game continues...\n")
-                    time.sleep(1.5)
-                    return True  # Continue playing
-            
-            # No lives left - permanent death
-            print("\nGame Over. You can NEVER play again.")
-            hardcore_player.mark_dead()
-            return False
-    else:
-        print("You survived this round!")
-        print(f"Chamber {chamber}/6 was empty.")
-        return True
+    print("System File Sacrifice: Available" if get_hardcore_lives().has_lives() else "No system files available")
+
+    return _play_round(get_hardcore_session(), hardcore=True)
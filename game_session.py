@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+I/O-free core of a Russian Roulette game.
+A GameSession takes events (spin, pull, continue, quit) and returns typed
+results. It never prompts, prints or sleeps, so the CLI, bots, servers and
+benchmarks can all drive the same rules.
+"""
+
+import random
+from typing import NamedTuple, Optional
+
+from rules import EMPTY, JAM, DUD, BANG, NORMAL_RULES
+
+# Events
+SPIN = "spin"
+PULL = "pull"
+CONTINUE = "continue"
+QUIT = "quit"
+
+# Session states
+READY = "ready"      # waiting for a spin
+SPUN = "spun"        # cylinder spun, waiting for the trigger pull
+FIRED = "fired"      # trigger pulled and survived, waiting for continue/quit
+OVER = "over"        # dead or walked away
+
+# Pull outcomes, besides EMPTY, JAM and DUD from rules
+REVIVED = "revived"  # BANG, but an extra life was consumed
+DEAD = "dead"        # BANG with no lives left
+
+
+class SpinResult(NamedTuple):
+    round: int
+
+
+class PullResult(NamedTuple):
+    round: int
+    chamber: int
+    outcome: str
+    alive: bool
+    lives_before: Optional[int]
+    lives_after: Optional[int]
+
+
+class ContinueResult(NamedTuple):
+    next_round: int
+
+
+class EndResult(NamedTuple):
+    rounds_survived: int
+    lives_consumed: int
+    alive: bool
+
+
+class CountedLives:
+    """In-memory lives backend for bots and simulations"""
+    def __init__(self, lives=0):
+        self.lives = lives
+
+    def count_lives(self):
+        return self.lives
+
+    def has_lives(self):
+        return self.lives > 0
+
+    def consume_life(self):
+        if self.lives <= 0:
+            return False
+        self.lives -= 1
+        return True
+
+
+class GameSession:
+    """
+    State machine for one player's session.
+    lives is any backend with has_lives/consume_life/count_lives
+    (LivesManager, HardcoreLivesManager, CountedLives); backends whose
+    count is not a number set counted = False and are never counted.
+    player, if given, is marked dead on a fatal BANG; with revive_player it
+    is also revived when a life saves it (hardcore). rules is a Rules tuple whose compiled
+    table picks chamber and outcome in one draw per round. on_bang, if
+    given, is called with the session on every BANG before a life is
+    consumed. journal, if given, records every pull under session_id.
+    """
+    def __init__(self, lives=None, player=None, rules=NORMAL_RULES,
+                 rng=None, on_bang=None, journal=None, session_id=0, revive_player=False):
+        self.lives = lives if lives is not None else CountedLives()
+        self._counted = getattr(self.lives, "counted", True)
+        self.player = player
+        self.revive_player = revive_player
+        self.on_bang = on_bang
+        self.journal = journal
+        self.session_id = session_id
+        self.rules = rules
+        self.outcomes = rules.compile()
+        self.rng = rng or random.Random()
+
+        self.state = READY
+        self.round = 0
+        self.rounds_survived = 0
+        self.lives_consumed = 0
+        self.chamber = None
+        self._outcome = None
+        self.dead = False
+
+    def handle(self, event):
+        """Dispatch an event name to its handler"""
+        handlers = {
+            SPIN: self.spin,
+            PULL: self.pull,
+            CONTINUE: self.continue_,
+            QUIT: self.quit,
+        }
+        if event not in handlers:
+            raise ValueError(f"Unknown event: {event!r}")
+        return handlers[event]()
+
+    def _expect(self, *states):
+        if self.state not in states:
+            raise ValueError(f"Event not allowed in state {self.state!r}")
+
+    def _count_lives(self):
+        if not self._counted:
+            return None
+        count = self.lives.count_lives()
+        return count if isinstance(count, int) else None
+
+    def spin(self):
+        """Spin the cylinder and pick the chamber for this round"""
+        self._expect(READY)
+        self.round += 1
+        self.chamber, self._outcome = self.outcomes.pull(self.rng)
+        self.state = SPUN
+        return SpinResult(self.round)
+
+    def pull(self):
+        """Pull the trigger on the spun chamber"""
+        self._expect(SPUN)
+        lives_before = self._count_lives()
+
+        outcome = self._outcome
+        if outcome == BANG:
+            if self.on_bang is not None:
+                self.on_bang(self)
+            if self.lives.has_lives() and self.lives.consume_life():
+                outcome = REVIVED
+                self.lives_consumed += 1
+                if self.revive_player and self.player is not None:
+                    self.player.revive()
+            else:
+                outcome = DEAD
+
+        alive = outcome != DEAD
+        if alive:
+            self.rounds_survived += 1
+            self.state = FIRED
+        else:
+            self.state = OVER
+            self.dead = True
+            if self.player is not None:
+                self.player.mark_dead()
+
+        lives_after = lives_before if outcome != REVIVED else self._count_lives()
+        result = PullResult(self.round, self.chamber, outcome, alive,
+                            lives_before, lives_after)
+        if self.journal is not None:
+            self.journal.append(result, self.session_id)
+        return result
+
+    def continue_(self):
+        """Play another round"""
+        self._expect(FIRED)
+        self.state = READY
+        return ContinueResult(self.round + 1)
+
+    def quit(self):
+        """Walk away (or acknowledge death) and end the session"""
+        self.state = OVER
+        return EndResult(self.rounds_survived, self.lives_consumed, not self.dead)
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Columnar, memory-mapped round history for analytics.
+Every field lives in its own flat file of fixed-width values, so a query
+over one field touches only that column. Columns are read through mmap as
+memoryviews: slicing them never copies, and counting outcome codes runs
+in C over the mapped bytes. (numpy.frombuffer on a view is zero-copy too,
+for anyone who has numpy around.)
+"""
+
+import mmap
+import sys
+from array import array
+from collections import Counter
+from itertools import compress
+from pathlib import Path
+
+from game_session import DEAD
+from journal import OUTCOME_CODES, OUTCOME_NAMES
+
+# Column name -> array typecode
+COLUMNS = {
+    "session": "I",   # session id
+    "round": "I",     # round number within the session (1-based)
+    "chamber": "B",
+    "outcome": "B",   # journal outcome code
+    "lives": "i",     # lives before the pull (-1 if unknown)
+}
+FLUSH_EVERY = 65536
+SCAN_CHUNK = 1 << 20  # rows per slice when counting outcome codes
+ROUND_ONE = array("I", [1]).tobytes()
+
+
+class HistoryStore:
+    """One directory, one file per column"""
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.buffers = {name: array(code) for name, code in COLUMNS.items()}
+        self._maps = {}
+        self._files = {}
+        sizes = {name: self._column_path(name).stat().st_size // array(code).itemsize
+                 if self._column_path(name).exists() else 0
+                 for name, code in COLUMNS.items()}
+        # A crash mid-flush can leave columns of different lengths
+        self.stored = min(sizes.values())
+        for name, code in COLUMNS.items():
+            if sizes[name] != self.stored:
+                with open(self._column_path(name), 'r+b') as f:
+                    f.truncate(self.stored * array(code).itemsize)
+
+    def _column_path(self, name):
+        return self.directory / f"{name}.col"
+
+    def __len__(self):
+        return self.stored + len(self.buffers["session"])
+
+    def append(self, session_id, round_, chamber, outcome, lives):
+        """Add one round; outcome is a GameSession outcome name"""
+        buffers = self.buffers
+        buffers["session"].append(session_id)
+        buffers["round"].append(round_)
+        buffers["chamber"].append(chamber)
+        buffers["outcome"].append(OUTCOME_CODES[outcome])
+        buffers["lives"].append(lives)
+        if len(buffers["session"]) >= FLUSH_EVERY:
+            self.flush()
+
+    def append_result(self, session_id, result):
+        """Add a PullResult from GameSession.pull()"""
+        lives = result.lives_before if result.lives_before is not None else -1
+        self.append(session_id, result.round, result.chamber, result.outcome, lives)
+
+    def import_journal(self, journal, start=0):
+        """Copy records from a RoundJournal; returns how many were added"""
+        added = 0
+        for record in journal.read(start):
+            self.append(record.session_id, record.round, record.chamber,
+                        record.outcome, record.lives_before)
+            added += 1
+        return added
+
+    def flush(self):
+        """Write buffered rounds to the column files"""
+        if not self.buffers["session"]:
+            return
+        self._close_maps()
+        for name, buffer in self.buffers.items():
+            with open(self._column_path(name), 'ab') as f:
+                buffer.tofile(f)
+        self.stored += len(self.buffers["session"])
+        self.buffers = {name: array(code) for name, code in COLUMNS.items()}
+
+    def _close_maps(self):
+        for view in self._maps.values():
+            view.release()
+        for mm, f in self._files.values():
+            try:
+                mm.close()
+            except BufferError:
+                pass  # a caller still holds a view; the map closes when it is dropped
+            f.close()
+        self._maps = {}
+        self._files = {}
+
+    def close(self):
+        self.flush()
+        self._close_maps()
+
+    def column(self, name, start=0, stop=None):
+        """Zero-copy typed view of rows start..stop-1 of one column"""
+        self.flush()
+        stop = self.stored if stop is None else min(stop, self.stored)
+        if name not in self._maps:
+            if self.stored == 0:
+                return memoryview(array(COLUMNS[name]))
+            f = open(self._column_path(name), 'rb')
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._files[name] = (mm, f)
+            self._maps[name] = memoryview(mm).cast(COLUMNS[name])
+        return self._maps[name][start:stop]
+
+    def _raw(self, name):
+        """The column's mmap itself (None while the store is empty)"""
+        self.column(name)
+        entry = self._files.get(name)
+        return entry[0] if entry else None
+
+    def session_rows(self, session_id):
+        """(start, stop) rows of a session, for stores appended in session order"""
+        sessions = self.column("session")
+        lo, hi = 0, len(sessions)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if sessions[mid] < session_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        start = lo
+        hi = len(sessions)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if sessions[mid] <= session_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        return start, lo
+
+    def outcome_counts(self, start=0, stop=None):
+        """Rounds per outcome name over a row range"""
+        counts = {name: 0 for name in OUTCOME_NAMES.values()}
+        raw = self._raw("outcome")
+        if raw is None:
+            return counts
+        stop = self.stored if stop is None else min(stop, self.stored)
+        # bytes.count runs at memory speed; slicing the map a chunk at a time
+        # keeps the working set to one chunk instead of a copy of the column
+        for chunk_start in range(start, stop, SCAN_CHUNK):
+            chunk = raw[chunk_start:min(chunk_start + SCAN_CHUNK, stop)]
+            for code, name in OUTCOME_NAMES.items():
+                counts[name] += chunk.count(bytes([code]))
+        return counts
+
+    def jam_rate(self, start=0, stop=None):
+        """Observed jam/dud share of loaded-chamber rounds"""
+        counts = self.outcome_counts(start, stop)
+        loaded = counts["jam"] + counts["dud"] + counts["dead"] + counts["revived"]
+        return (counts["jam"] + counts["dud"]) / loaded if loaded else 0.0
+
+    def session_ends(self):
+        """Row of the last round of every session"""
+        raw = self._raw("round")
+        if raw is None:
+            return []
+        width = len(ROUND_ONE)
+        starts = []
+        # Sessions start at round 1; mmap.find() scans the map in C without
+        # copying it, and misaligned hits are skipped
+        pos = raw.find(ROUND_ONE)
+        while pos != -1:
+            if pos % width == 0:
+                starts.append(pos // width)
+                pos = raw.find(ROUND_ONE, pos + width)
+            else:
+                pos = raw.find(ROUND_ONE, pos + 1)
+        return [start - 1 for start in starts[1:]] + [self.stored - 1]
+
+    def survival_curve(self, max_rounds=None):
+        """
+        Kaplan-Meier estimate of P(survive at least k rounds), k = 0..max.
+        Every session that reached round k has exactly one row with that
+        round number, so the risk set is a histogram of the round column;
+        sessions that walked away alive simply have no later rows (censored).
+        """
+        rounds = self.column("round")
+        if not rounds:
+            return [1.0]
+        dead_code = OUTCOME_CODES[DEAD]
+        # Both histograms are built by C iterators straight over the maps
+        at_risk = Counter(rounds)
+        deaths = Counter(compress(rounds, map(dead_code.__eq__, self.column("outcome"))))
+        horizon = max(at_risk)
+        if max_rounds is not None:
+            horizon = min(horizon, max_rounds)
+        curve = [1.0]
+        survival = 1.0
+        for k in range(1, horizon + 1):
+            if at_risk[k]:
+                survival *= 1.0 - deaths[k] / at_risk[k]
+            curve.append(survival)
+        return curve
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python3 history_store.py <store directory> [journal to import]")
+        sys.exit(1)
+    store = HistoryStore(sys.argv[1])
+    if len(sys.argv) > 2:
+        from journal import RoundJournal
+        print(f"Imported {store.import_journal(RoundJournal(sys.argv[2])):,} rounds")
+    print(f"{len(store):,} rounds stored")
+    print(f"Outcomes: {store.outcome_counts()}")
+    print(f"Observed jam/dud rate: {store.jam_rate():.4f}")
+    curve = store.survival_curve(20)
+    for k in range(0, len(curve), 5):
+        print(f"  P(survive {k:>3} rounds) = {curve[k]:.4f}")
+    store.close()
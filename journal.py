@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Append-only binary journal of played rounds.
+Rounds are fixed-width struct records grouped into checksummed blocks
+(optionally zlib-compressed). A sparse side index maps the first round of
+every block to its file offset, so seeking to round N is a bisect plus one
+block read, and crash recovery only has to verify the tail of the file.
+Several processes may append to one journal: writers take a lock on
+<path>.lock, pick up blocks the others wrote, then number their own.
+"""
+
+import os
+import struct
+import sys
+import time
+import zlib
+from bisect import bisect_right
+from pathlib import Path
+from typing import NamedTuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from game_session import EMPTY, JAM, DUD, REVIVED, DEAD
+
+# Outcome codes stored on disk
+OUTCOME_CODES = {EMPTY: 0, JAM: 1, DUD: 2, DEAD: 3, REVIVED: 4}
+OUTCOME_NAMES = {code: name for name, code in OUTCOME_CODES.items()}
+NO_LIVES = -1  # lives unknown (hardcore mode)
+
+# timestamp, session id, round, chamber, outcome, lives before, lives after
+RECORD = struct.Struct("<dIIBBii")
+# magic, flags, record count, first record number, payload size, crc32
+BLOCK_HEADER = struct.Struct("<4sBIQII")
+BLOCK_MAGIC = b"RRJB"
+FLAG_ZLIB = 1
+# first record number, block offset
+INDEX_ENTRY = struct.Struct("<QQ")
+
+
+class _FileLock:
+    """Exclusive inter-process lock held for the duration of a with block"""
+    def __init__(self, path):
+        self.file = open(path, 'a+b')
+
+    def __enter__(self):
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+        else:
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        else:
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def close(self):
+        self.file.close()
+
+
+class JournalRecord(NamedTuple):
+    timestamp: float
+    session_id: int
+    round: int
+    chamber: int
+    outcome: str
+    lives_before: int
+    lives_after: int
+
+
+def _pack(record):
+    return RECORD.pack(record.timestamp, record.session_id, record.round, record.chamber,
+                       OUTCOME_CODES[record.outcome], record.lives_before, record.lives_after)
+
+
+def _unpack(payload):
+    for fields in RECORD.iter_unpack(payload):
+        timestamp, session_id, round_, chamber, code, before, after = fields
+        yield JournalRecord(timestamp, session_id, round_, chamber, OUTCOME_NAMES[code],
+                            before, after)
+
+
+class RoundJournal:
+    """
+    Journal file plus its sparse index (<path>.idx).
+    Records are buffered until block_records of them are queued (or
+    flush() is called) and then written as one block.
+    """
+    def __init__(self, path, block_records=256, compress=False):
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + ".idx")
+        self.block_records = block_records
+        self.compress = compress
+        self.pending = []
+
+        self.block_starts = []   # first record number of every block
+        self.block_offsets = []  # file offset of every block
+        self.count = 0           # records safely on disk
+        self.end = 0             # file offset just past the last known block
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = _FileLock(self.path.with_name(self.path.name + ".lock"))
+        with self.lock:
+            self._recover()
+        self.file = open(self.path, 'ab')
+        self.index_file = open(self.index_path, 'ab')
+
+    def __len__(self):
+        return self.count + len(self.pending)
+
+    def _read_block(self, file, offset):
+        """(header fields, payload) of the block at offset, or None if torn/corrupt"""
+        file.seek(offset)
+        raw = file.read(BLOCK_HEADER.size)
+        if len(raw) < BLOCK_HEADER.size:
+            return None
+        magic, flags, count, first, size, crc = BLOCK_HEADER.unpack(raw)
+        if magic != BLOCK_MAGIC:
+            return None
+        payload = file.read(size)
+        if len(payload) < size or zlib.crc32(payload) != crc:
+            return None
+        if flags & FLAG_ZLIB:
+            payload = zlib.decompress(payload)
+        if len(payload) != count * RECORD.size:
+            return None
+        return (count, first, size), payload
+
+    def _recover(self):
+        """Load the index, verify blocks past it and cut off a torn tail"""
+        if not self.path.exists():
+            self.index_path.write_bytes(b"")
+            return
+        file_size = self.path.stat().st_size
+
+        # Trust index entries that point inside the journal
+        entries = []
+        if self.index_path.exists():
+            data = self.index_path.read_bytes()
+            data = data[:len(data) - len(data) % INDEX_ENTRY.size]
+            entries = [e for e in INDEX_ENTRY.iter_unpack(data) if e[1] < file_size]
+
+        with open(self.path, 'rb') as file:
+            # Re-verify the last indexed block, then walk forward from it
+            while entries and self._read_block(file, entries[-1][1]) is None:
+                entries.pop()
+            offset = 0
+            count = 0
+            if entries:
+                first, offset = entries[-1]
+                (n, _, size), _ = self._read_block(file, offset)
+                count = first + n
+                offset += BLOCK_HEADER.size + size
+
+            while True:
+                block = self._read_block(file, offset)
+                if block is None:
+                    break
+                (n, first, size), _ = block
+                entries.append((first, offset))
+                count = first + n
+                offset += BLOCK_HEADER.size + size
+
+        if offset < file_size:
+            # Torn or corrupt tail from a crash mid-write
+            with open(self.path, 'r+b') as file:
+                file.truncate(offset)
+
+        self.block_starts = [first for first, _ in entries]
+        self.block_offsets = [off for _, off in entries]
+        self.count = count
+        self.end = offset
+        self.index_path.write_bytes(b"".join(INDEX_ENTRY.pack(*e) for e in entries))
+
+    def _catch_up(self):
+        """Pick up blocks other processes appended since we last looked"""
+        with open(self.path, 'rb') as file:
+            while True:
+                block = self._read_block(file, self.end)
+                if block is None:
+                    return
+                (n, first, size), _ = block
+                self.block_starts.append(first)
+                self.block_offsets.append(self.end)
+                self.count = first + n
+                self.end += BLOCK_HEADER.size + size
+
+    def append(self, result, session_id=0, timestamp=None):
+        """Journal a PullResult from GameSession.pull()"""
+        before = result.lives_before if result.lives_before is not None else NO_LIVES
+        after = result.lives_after if result.lives_after is not None else NO_LIVES
+        self.append_record(JournalRecord(
+            time.time() if timestamp is None else timestamp,
+            session_id, result.round, result.chamber, result.outcome, before, after))
+
+    def append_record(self, record):
+        self.pending.append(record)
+        if len(self.pending) >= self.block_records:
+            self.flush()
+
+    def flush(self, sync=False):
+        """Write buffered records as one block"""
+        if not self.pending:
+            return
+        payload = b"".join(_pack(record) for record in self.pending)
+        flags = 0
+        if self.compress:
+            payload = zlib.compress(payload)
+            flags |= FLAG_ZLIB
+        with self.lock:
+            # Number our block after whatever the other writers added
+            self._catch_up()
+            if self.file.seek(0, os.SEEK_END) > self.end:
+                self.file.truncate(self.end)  # torn block from a writer that crashed
+            header = BLOCK_HEADER.pack(BLOCK_MAGIC, flags, len(self.pending), self.count,
+                                       len(payload), zlib.crc32(payload))
+            offset = self.end
+            self.file.write(header + payload)
+            self.file.flush()
+            if sync:
+                os.fsync(self.file.fileno())
+            self.index_file.write(INDEX_ENTRY.pack(self.count, offset))
+            self.index_file.flush()
+
+            self.block_starts.append(self.count)
+            self.block_offsets.append(offset)
+            self.count += len(self.pending)
+            self.end = offset + len(header) + len(payload)
+        self.pending = []
+
+    def close(self):
+        self.flush()
+        self.file.close()
+        self.index_file.close()
+        self.lock.close()
+
+    def read(self, start=0, stop=None):
+        """Yield records start..stop-1 (by record number)"""
+        self.flush()
+        self._catch_up()
+        stop = self.count if stop is None else min(stop, self.count)
+        if start >= stop:
+            return
+        block = max(bisect_right(self.block_starts, start) - 1, 0)
+        with open(self.path, 'rb') as file:
+            for offset in self.block_offsets[block:]:
+                (n, first, _), payload = self._read_block(file, offset)
+                if first >= stop:
+                    return
+                for number, record in enumerate(_unpack(payload), first):
+                    if number >= stop:
+                        return
+                    if number >= start:
+                        yield record
+
+    def record(self, number):
+        """Record number N, located through the sparse index"""
+        for record in self.read(number, number + 1):
+            return record
+        raise IndexError(f"journal has no record {number}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python3 journal.py <journal file> [first] [last]")
+        sys.exit(1)
+    journal = RoundJournal(sys.argv[1])
+    first = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    last = int(sys.argv[3]) if len(sys.argv) > 3 else len(journal)
+    print(f"{len(journal):,} rounds journaled")
+    for record in journal.read(first, last):
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(record.timestamp))
+        print(f"{stamp} session {record.session_id} round {record.round}: "
+              f"chamber {record.chamber} {record.outcome} "
+              f"(lives {record.lives_before} -> {record.lives_after})")
+    journal.close()
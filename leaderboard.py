@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Live top-k leaderboards: longest survival streaks and most lives burned.
+Each board keeps every player's personal best plus a bounded min-heap of
+the current top k, so a round costs O(log k) and a query never rescans
+history.
+"""
+
+import heapq
+import random
+import sys
+
+from game_session import REVIVED, DEAD
+
+DEFAULT_SIZE = 10
+
+
+class TopK:
+    """Top k players by their best value, updated incrementally"""
+    def __init__(self, k=DEFAULT_SIZE):
+        self.k = k
+        self.best = {}     # player -> personal best
+        self._top = {}     # player -> value, for players currently on the board
+        self._heap = []    # (value, -seq, player); entries no longer in _top are stale
+        self._seq = 0
+        self._snapshot = ()
+
+    def __len__(self):
+        return len(self._top)
+
+    def offer(self, player, value):
+        """Record a value for player; returns True if the board changed"""
+        if value <= self.best.get(player, 0):
+            return False
+        self.best[player] = value
+
+        if player not in self._top and len(self._top) >= self.k:
+            lowest, _, _ = self._min()
+            if value <= lowest:
+                return False
+            _, _, evicted = heapq.heappop(self._heap)
+            del self._top[evicted]
+
+        self._top[player] = value
+        self._seq += 1
+        # Earlier achievers win ties, so later entries sort lower
+        heapq.heappush(self._heap, (value, -self._seq, player))
+        if len(self._heap) > 2 * self.k + 16:
+            self._compact()
+        self._snapshot = None
+        return True
+
+    def _min(self):
+        """Lowest live heap entry, dropping stale ones on the way"""
+        heap = self._heap
+        while self._top.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0]
+
+    def _compact(self):
+        live = {}
+        for value, order, player in self._heap:
+            if self._top.get(player) == value:
+                live[player] = (value, order, player)
+        self._heap = list(live.values())
+        heapq.heapify(self._heap)
+
+    def snapshot(self):
+        """[(player, value)] best first; cached until the board changes"""
+        if self._snapshot is None:
+            self._compact()
+            entries = sorted(self._heap, reverse=True)
+            self._snapshot = tuple((player, value) for value, _, player in entries)
+        return self._snapshot
+
+
+class Leaderboard:
+    """Longest-streak and most-lives-burned boards fed one PullResult at a time"""
+    def __init__(self, k=DEFAULT_SIZE):
+        self.streaks = TopK(k)
+        self.lives_burned = TopK(k)
+        self._streak = {}  # player -> rounds survived in a row this session
+        self._burned = {}  # player -> lives burned in total
+
+    def record(self, player, result):
+        """Feed the result of one pull by player"""
+        streak = 0 if result.round == 1 else self._streak.get(player, 0)
+        if result.outcome in (REVIVED, DEAD):
+            streak = 0
+        else:
+            streak += 1
+            self.streaks.offer(player, streak)
+        self._streak[player] = streak
+
+        if result.outcome == REVIVED:
+            burned = self._burned.get(player, 0) + 1
+            self._burned[player] = burned
+            self.lives_burned.offer(player, burned)
+
+    def snapshot(self):
+        return {"streaks": self.streaks.snapshot(),
+                "lives_burned": self.lives_burned.snapshot()}
+
+
+if __name__ == "__main__":
+    from stats_utils import simulated_rounds
+
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    lives = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    players = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+    board = Leaderboard()
+    for session_id, result in simulated_rounds(sessions, lives, rng=random.Random(0)):
+        board.record(f"player-{session_id % players}", result)
+
+    for title, entries in (("Longest streaks", board.streaks.snapshot()),
+                           ("Most lives burned", board.lives_burned.snapshot())):
+        print(title)
+        for rank, (player, value) in enumerate(entries, 1):
+            print(f"  {rank:>2}. {player:<14} {value}")
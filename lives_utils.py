@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Utility classes for the extra lives system.
+"""
+
+import os
+import time
+from bisect import bisect_left
+from pathlib import Path
+
+# Life files are renamed to this prefix to claim them before deletion,
+# so concurrent game processes can never consume the same life twice
+CLAIM_PREFIX = ".claimed-"
+
+# A directory modified this close to our scan may change again without its
+# mtime moving (same timestamp tick), so such a scan is not trusted.
+RACY_WINDOW_NS = 20_000_000          # filesystems with sub-second mtimes
+RACY_WINDOW_COARSE_NS = 2_000_000_000  # FAT and friends: 1-2 second mtimes
+
+
+class LivesStore:
+    """
+    Life files ordered by modification time.
+    Backed by sorted arrays plus a head offset for consumed entries, so
+    consuming the oldest life is O(1) amortized and "how many lives were
+    valid at cutoff T" is a single O(log n) bisect.
+    """
+    def __init__(self, entries=()):
+        entries = sorted(entries)
+        self.mtimes = [mtime for mtime, _ in entries]
+        self.paths = [path for _, path in entries]
+        self.head = 0  # entries before this index have been consumed
+
+    def __len__(self):
+        return len(self.paths) - self.head
+
+    def count_valid_at(self, cutoff):
+        """Number of lives modified before cutoff"""
+        return bisect_left(self.mtimes, cutoff, self.head) - self.head
+
+    def valid_at(self, cutoff):
+        """Lives modified before cutoff, oldest first"""
+        return self.paths[self.head:bisect_left(self.mtimes, cutoff, self.head)]
+
+    def oldest(self, cutoff=None):
+        """Oldest life (valid at cutoff, if given), or None"""
+        if self.head >= len(self.paths):
+            return None
+        if cutoff is not None and self.mtimes[self.head] >= cutoff:
+            return None
+        return self.paths[self.head]
+
+    def pop_oldest(self):
+        """Remove and return the oldest life"""
+        path = self.oldest()
+        if path is None:
+            return None
+        self.head += 1
+        # Reclaim the consumed prefix once it outweighs the live entries
+        if self.head > 64 and self.head * 2 > len(self.paths):
+            del self.mtimes[:self.head]
+            del self.paths[:self.head]
+            self.head = 0
+        return path
+
+    def entries(self):
+        """(mtime, path) for every life, oldest first"""
+        return list(zip(self.mtimes[self.head:], self.paths[self.head:]))
+
+
+class LivesIndex:
+    """
+    Cached, mtime-sorted view of the life files in a folder.
+    The folder is only rescanned when its own mtime changes (a file was
+    added, removed or renamed), so repeated queries cost one stat() call,
+    and a rescan only stat()s files it has not seen before. Touching an
+    existing life file changes neither; call invalidate() if that needs to
+    be picked up.
+    """
+    def __init__(self, folder):
+        self.folder = Path(folder)
+        self.store = LivesStore()
+        self._stamp = None
+        self._trusted = False
+        self._known = {}  # file name -> (inode, mtime) from the last scan
+        self.scans = 0
+
+    def _folder_stamp(self):
+        try:
+            return os.stat(self.folder).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def invalidate(self):
+        """Force a full rescan (every file re-stat()ed) on the next query"""
+        self._stamp = None
+        self._trusted = False
+        self._known = {}
+
+    def refresh(self):
+        """Rescan the folder if it changed since the last scan"""
+        stamp = self._folder_stamp()
+        if stamp is not None and stamp == self._stamp and self._trusted:
+            return
+        self._scan(stamp)
+
+    def _scan(self, stamp):
+        scan_time = time.time_ns()
+        known = {}
+        entries = []
+        if stamp is not None:
+            # scandir hands back file types (and inodes on POSIX) without a
+            # stat per entry; files seen by the last scan keep their mtime
+            with os.scandir(self.folder) as it:
+                for entry in it:
+                    if entry.name.startswith(CLAIM_PREFIX):
+                        continue
+                    try:
+                        inode = entry.inode()
+                        seen = self._known.get(entry.name)
+                        if seen is not None and seen[0] == inode:
+                            mtime = seen[1]
+                        elif entry.is_file():
+                            mtime = entry.stat().st_mtime
+                        else:
+                            continue
+                    except FileNotFoundError:
+                        continue  # claimed or deleted by another process mid-scan
+                    known[entry.name] = (inode, mtime)
+                    entries.append((mtime, entry.path))
+        self._known = known
+        self.store = LivesStore((mtime, Path(path)) for mtime, path in entries)
+        self._remember(stamp, scan_time)
+        self.scans += 1
+
+    def _remember(self, stamp, scan_time):
+        self._stamp = stamp
+        if stamp is None:
+            self._trusted = False
+            return
+        window = RACY_WINDOW_COARSE_NS if stamp % 1_000_000_000 == 0 else RACY_WINDOW_NS
+        self._trusted = stamp < scan_time - window
+
+    def valid(self, cutoff):
+        """Life files modified before cutoff, oldest first"""
+        self.refresh()
+        return self.store.valid_at(cutoff)
+
+    def count(self, cutoff):
+        """Number of life files modified before cutoff"""
+        self.refresh()
+        return self.store.count_valid_at(cutoff)
+
+    def entries(self):
+        """(mtime, path) for every life file, oldest first"""
+        self.refresh()
+        return self.store.entries()
+
+    def claim_oldest(self, cutoff):
+        """
+        Atomically take the oldest life file modified before cutoff.
+        The file is renamed to a per-process claim name; the rename only
+        succeeds for one process, so a life can never be consumed twice.
+        Returns (original path, claimed path), or None if no life is left.
+        """
+        self.refresh()
+        while True:
+            path = self.store.oldest(cutoff)
+            if path is None:
+                return None
+            claimed = path.with_name(f"{CLAIM_PREFIX}{os.getpid()}-{path.name}")
+            try:
+                os.rename(path, claimed)
+            except FileNotFoundError:
+                # Another process claimed it first, try the next oldest
+                self.store.pop_oldest()
+                continue
+            self.store.pop_oldest()
+            return path, claimed
+
+    def release_claim(self, claimed):
+        """Delete a claimed life file"""
+        claimed.unlink()
+        # Rescan on the next query (known files are not re-stat()ed), so
+        # changes other processes made meanwhile are not missed
+        self._stamp = None
+
+
+class LivesLedger:
+    """
+    SQLite-backed alternative to one file per life.
+    Lives are stored as grants: a grant time plus how many lives are left
+    from it, so a bulk grant of a million lives is a single row. A life is
+    valid only if it was granted before the cutoff (death time), the same
+    rule get_valid_lives applies to file mtimes.
+    """
+    def __init__(self, db_path):
+        import sqlite3  # only needed when the ledger backend is in use
+
+        self.db_path = Path(db_path)
+        self.db = sqlite3.connect(str(self.db_path), isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS grants ("
+            " id INTEGER PRIMARY KEY,"
+            " granted REAL NOT NULL,"
+            " remaining INTEGER NOT NULL,"
+            " source TEXT)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS grants_by_time ON grants (granted, id)")
+
+    def close(self):
+        self.db.close()
+
+    def grant(self, count=1, when=None, source=None):
+        """Add count lives granted at when (defaults to now)"""
+        if count < 0:
+            raise ValueError(f"Cannot grant a negative number of lives: {count}")
+        if count == 0:
+            return
+        when = time.time() if when is None else when
+        self.db.execute("INSERT INTO grants (granted, remaining, source) VALUES (?, ?, ?)",
+                        (when, count, source))
+
+    def grant_many(self, grants):
+        """Bulk insert of (when, count, source) grants in one transaction"""
+        with self.db:
+            self.db.execute("BEGIN")
+            self.db.executemany(
+                "INSERT INTO grants (granted, remaining, source) VALUES (?, ?, ?)",
+                ((when, count, source) for when, count, source in grants if count > 0))
+
+    def count_valid_at(self, cutoff):
+        """Number of lives granted before cutoff"""
+        row = self.db.execute("SELECT COALESCE(SUM(remaining), 0) FROM grants "
+                              "WHERE granted < ?", (cutoff,)).fetchone()
+        return row[0]
+
+    def valid_at(self, cutoff):
+        """(granted, remaining, source) for grants before cutoff, oldest first"""
+        return self.db.execute("SELECT granted, remaining, source FROM grants "
+                               "WHERE granted < ? ORDER BY granted, id", (cutoff,)).fetchall()
+
+    def consume(self, count=1, cutoff=None):
+        """
+        Consume up to count of the oldest lives valid at cutoff.
+        Returns the sources of the consumed lives (one entry per life).
+        """
+        if count < 0:
+            raise ValueError(f"Cannot consume a negative number of lives: {count}")
+        if count == 0:
+            return []
+        cutoff = time.time() if cutoff is None else cutoff
+        consumed = []
+        with self.db:
+            # Take the write lock up front so concurrent consumers serialize
+            self.db.execute("BEGIN IMMEDIATE")
+            rows = self.db.execute("SELECT id, remaining, source FROM grants "
+                                   "WHERE granted < ? ORDER BY granted, id", (cutoff,))
+            for grant_id, remaining, source in rows.fetchmany(count):
+                take = min(remaining, count - len(consumed))
+                if take == remaining:
+                    self.db.execute("DELETE FROM grants WHERE id = ?", (grant_id,))
+                else:
+                    self.db.execute("UPDATE grants SET remaining = remaining - ? WHERE id = ?",
+                                    (take, grant_id))
+                consumed.extend([source] * take)
+                if len(consumed) >= count:
+                    break
+        return consumed
+
+    def import_life_files(self, folder, remove=False):
+        """
+        One-shot import of an existing lives folder. Each file becomes a
+        grant at its mtime, so validity against the death time is kept.
+        With remove=True the imported files are deleted afterwards.
+        """
+        folder = Path(folder)
+        if not folder.exists():
+            return 0
+        files = []
+        with os.scandir(folder) as it:
+            for entry in it:
+                # Claimed files are being consumed by a running game
+                if entry.name.startswith(CLAIM_PREFIX):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    mtime = entry.stat().st_mtime
+                    path = Path(entry.path)
+                    if remove:
+                        # Claim it first so no game process can consume it too
+                        claimed = path.with_name(f"{CLAIM_PREFIX}{os.getpid()}-{path.name}")
+                        os.rename(path, claimed)
+                        path = claimed
+                except FileNotFoundError:
+                    continue  # claimed or deleted by another process
+                files.append((mtime, path, entry.name))
+        self.grant_many((mtime, 1, name) for mtime, _, name in files)
+        if remove:
+            for _, path, _ in files:
+                path.unlink()
+        return len(files)
@@ -8,23 +8,50 @@ Lives system allows extra chances.
 import os
 import random
 import sys
-from game_lib import play_round, player, lives_manager
+from game_lib import play_round, get_player, get_lives_manager, get_session
+from policy import get_policy
+from stats_utils import journal_stats
+
+def print_lifetime_stats(session):
+    """Summarize every round this player has ever journaled"""
+    stats = journal_stats(session.journal, session.rules)
+    median = stats.session_lengths.quantile(0.5) or 0
+    print(f"📊 {stats.sessions} sessions, {stats.rounds} rounds played, "
+          f"median {median:.0f} rounds, longest streak {stats.report()['longest_streak']}")
+    print(f"   Jams/duds saved you {stats.jam_dud_rate():.0%} of the time "
+          f"(odds: {stats.rules.failure_rate:.0%})")
+
+
+def print_hint(session, lives_manager):
+    """Stop-or-continue advice for the decision in front of the player"""
+    policy = get_policy(session.rules)
+    print(policy.hint(lives_manager.count_lives(), session.rounds_survived))
+
+
+def exit_dead(player):
+    """Tell a dead player with no lives left that the game is over, and exit"""
+    print("💀 You're already DEAD!")
+    
+    # Display time of death if available
+    death_time = player.get_death_time()
+    if death_time:
+        print(f"Time of death: {death_time}")
+    
+    print("You cannot play Russian Roulette anymore.")
+    print("\nThis is permanent. There is no reset.")
+    print("Unless you sacrafice a file to the Lives directory predating your death.")
+    sys.exit(1)
+
 
 def main():
     """Main game loop"""
+    player = get_player()
+    lives_manager = get_lives_manager()
+    session = get_session()
+    
     # Check if player is dead AND has no lives
     if player.is_dead() and not lives_manager.has_lives():
-        print("💀 You're already DEAD!")
-        
-        # Display time of death if available
-        death_time = player.get_death_time()
-        if death_time:
-            print(f"Time of death: {death_time}")
-        
-        print("You cannot play Russian Roulette anymore.")
-        print("\nThis is permanent. There is no reset.")
-        print("Unless you sacrafice a file to the Lives directory predating your death.")
-        sys.exit(1)
+        exit_dead(player)
     
     # If dead but has lives, revive them
     if player.is_dead() and lives_manager.has_lives():
@@ -32,7 +59,9 @@ def main():
         print("💀 You were dead, but you have extra lives!")
         if death_time:
             print(f"   (Died at: {death_time})")
-        lives_manager.consume_life()
+        # Another game may have taken the last life since has_lives()
+        if not lives_manager.consume_life():
+            exit_dead(player)
         # Revive/Clear the death marker
         player.revive()
         print("🔄 You've been revived!\n")
@@ -40,12 +69,15 @@ def main():
     print("=" * 40)
     print("   RUSSIAN ROULETTE")
     print("=" * 40)
-    print("\nWelcome! The revolver has 6 chambers.")
-    print("One bullet. Press ENTER to play.")
+    rules = session.rules
+    bullets = "One bullet" if rules.bullets == 1 else f"{rules.bullets} bullets"
+    print(f"\nWelcome! The revolver has {rules.chambers} chambers.")
+    print(f"{bullets}. Press ENTER to play.")
     print("⚠️  WARNING: If you die, you can NEVER play again.")
     print("💚 Extra lives can save you from permanent death!")
     print("This is PERMANENT. No resets.\n")
     
+    hints = False
     try:
         while True:
             survived = play_round()
@@ -53,8 +85,18 @@ def main():
                 break
             
             print("\n" + "=" * 40)
+            if hints:
+                print_hint(session, lives_manager)
             choice = input("\nPlay again? (y/n): ").strip().lower()
             
+            # 'h' toggles the stop-or-continue hint and asks again
+            while choice == 'h':
+                hints = not hints
+                print(f"\n💡 Hints {'enabled' if hints else 'disabled'}")
+                if hints:
+                    print_hint(session, lives_manager)
+                choice = input("\nPlay again? (y/n): ").strip().lower()
+            
             # Check for F3 debug toggle
             if choice == 'f3':
                 lives_manager.debug_mode = not lives_manager.debug_mode
@@ -63,7 +105,9 @@ def main():
                 continue
             
             if choice != 'y':
+                session.quit()
                 print("\nYou walk away alive. Wise choice.")
+                print_lifetime_stats(session)
                 break
     except KeyboardInterrupt:
         print("\n\nGame interrupted. You survive... for now.")
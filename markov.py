@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Exact survival odds for the play_round rules, without sampling.
+Each round is a step of a Markov chain over "lives consumed so far",
+with permanent death as the absorbing state.
+"""
+
+import sys
+from functools import lru_cache
+
+from rules import NORMAL_RULES
+
+
+def bang_probability(rules=NORMAL_RULES):
+    """Chance that a single round ends in a BANG (loaded chamber, no jam/dud)"""
+    return rules.bang_probability
+
+
+@lru_cache(maxsize=1024)
+def _chain(lives, rounds, p):
+    """
+    Run the chain for the given number of rounds.
+    Returns (survival curve, final state vector). The state vector has one
+    entry per lives consumed (0..lives) followed by the dead state.
+    """
+    q = 1.0 - p
+    state = [0.0] * (lives + 2)
+    state[0] = 1.0
+    curve = [1.0]
+
+    for _ in range(rounds):
+        dead = state[-1] + state[lives] * p
+        # Walk backwards so each entry still holds last round's value
+        for i in range(lives, 0, -1):
+            state[i] = state[i] * q + state[i - 1] * p
+        state[0] *= q
+        state[-1] = dead
+        curve.append(1.0 - dead)
+
+    return tuple(curve), tuple(state)
+
+
+def survival_curve(lives, rounds, rules=NORMAL_RULES):
+    """P(still alive after k rounds) for k = 0..rounds"""
+    return _chain(lives, rounds, rules.bang_probability)[0]
+
+
+def survival_probability(lives, rounds, rules=NORMAL_RULES):
+    """P(still alive after exactly this many rounds)"""
+    return _chain(lives, rounds, rules.bang_probability)[0][-1]
+
+
+def lives_distribution(lives, rounds, rules=NORMAL_RULES):
+    """
+    Distribution after the given number of rounds: one probability per
+    lives consumed (0..lives), followed by the probability of being dead.
+    """
+    return _chain(lives, rounds, rules.bang_probability)[1]
+
+
+@lru_cache(maxsize=1024)
+def expected_session_length(lives, rules=NORMAL_RULES):
+    """Expected rounds played until permanent death, fatal round included"""
+    # Each of the lives + 1 bangs is a geometric wait
+    return (lives + 1) / rules.bang_probability
+
+
+def survival_for_manager(manager, rounds, rules=NORMAL_RULES):
+    """Survival curve for the lives currently held by a LivesManager"""
+    lives = manager.count_lives()
+    return survival_curve(lives, rounds, rules)
+
+
+if __name__ == "__main__":
+    lives = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    curve = survival_curve(lives, rounds)
+    print(f"Extra lives: {lives}")
+    print(f"Expected session length: {expected_session_length(lives):.3f} rounds")
+    for k in range(0, rounds + 1, max(1, rounds // 10)):
+        print(f"  P(alive after {k:>4} rounds) = {curve[k]:.6f}")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Multi-core session simulation.
+Splits a session population into fixed-size chunks, runs them across a
+process pool and merges the per-chunk histograms into one report.
+"""
+
+import hashlib
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from rules import NORMAL_RULES
+from sim_lib import SessionStats, simulate_sessions
+
+# Work is split by chunk, not by worker, and every chunk has its own stream.
+# That way the result for a given seed does not depend on the worker count.
+CHUNK_SIZE = 50_000
+
+
+def chunk_rng(seed, chunk_index):
+    """Independent, reproducible random stream for one chunk"""
+    digest = hashlib.sha256(f"roulette:{seed}:{chunk_index}".encode()).digest()
+    return random.Random(int.from_bytes(digest, "big"))
+
+
+def _run_chunk(args):
+    seed, chunk_index, count, lives, rules, max_rounds = args
+    return simulate_sessions(count, lives, rules,
+                             rng=chunk_rng(seed, chunk_index),
+                             max_rounds=max_rounds)
+
+
+def _chunks(sessions, seed, lives, rules, max_rounds):
+    for index, start in enumerate(range(0, sessions, CHUNK_SIZE)):
+        count = min(CHUNK_SIZE, sessions - start)
+        yield (seed, index, count, lives, rules, max_rounds)
+
+
+def run_parallel(sessions, lives=0, seed=0, workers=None,
+                 rules=NORMAL_RULES, max_rounds=None):
+    """Simulate sessions across a process pool and return merged SessionStats"""
+    workers = workers or os.cpu_count() or 1
+    jobs = list(_chunks(sessions, seed, lives, rules, max_rounds))
+    report = SessionStats()
+
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            report.merge(_run_chunk(job))
+        return report
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map() yields in submission order, so merging is deterministic
+        for stats in pool.map(_run_chunk, jobs):
+            report.merge(stats)
+    return report
+
+
+if __name__ == "__main__":
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    lives = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+
+    start = time.perf_counter()
+    report = run_parallel(sessions, lives=lives, seed=seed)
+    elapsed = time.perf_counter() - start
+
+    print(f"Simulated {report.sessions:,} sessions "
+          f"({report.total_rounds():,} rounds) in {elapsed:.2f}s")
+    print(f"  Permanent deaths:      {report.deaths:,}")
+    print(f"  Mean rounds survived:  {report.mean_rounds_survived():.3f}")
+    print(f"  Total jams:            {sum(k * v for k, v in report.jams.items()):,}")
+    print(f"  Total duds:            {sum(k * v for k, v in report.duds.items()):,}")
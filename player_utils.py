@@ -1,20 +1,33 @@
-import os
-import platform
-from pathlib import Path
+from collections import OrderedDict
 from datetime import datetime
+from config_utils import get_paths
+from durable_utils import atomic_write
+
+
+def write_death_marker(death_file):
+    """Atomically write a death marker with the current timestamp"""
+    death_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Temp file + fsync + rename: readers and concurrent writers never see a
+    # half-written marker, and it survives a crash right after death
+    atomic_write(death_file, f"DEAD\n{death_time}\n")
+
+
+def remove_death_marker(death_file):
+    """Remove a death marker; another process removing it first is fine"""
+    try:
+        death_file.unlink()
+    except FileNotFoundError:
+        pass
+
 
 class Player:
-    def __init__(self):
+    def __init__(self, paths=None):
         """Get the path to the death marker file based on OS"""
-        if platform.system() == "Windows":
-            base_path = Path(os.getenv('LOCALAPPDATA', os.path.expanduser('~')))
-            config_dir = base_path / '.roulette'
-        else:  # Linux, macOS, etc.
-            config_dir = Path.home() / '.config' / 'roulette'
+        paths = paths or get_paths()
         
         # Create directory if it doesn't exist
-        config_dir.mkdir(parents=True, exist_ok=True)
-        self.death_file = config_dir / '.death_marker'
+        paths.config_dir.mkdir(parents=True, exist_ok=True)
+        self.death_file = paths.death_marker
 
 
     def is_dead(self):
@@ -39,31 +52,23 @@ class Player:
 
     def mark_dead(self):
         """Mark player as dead with timestamp"""
-        death_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(self.death_file, 'w') as f:
-            f.write("DEAD\n")
-            f.write(f"{death_time}\n")
+        write_death_marker(self.death_file)
     
     
     def revive(self):
         """Remove death marker - used when consuming a life"""
-        if self.death_file.exists():
-            self.death_file.unlink()
+        remove_death_marker(self.death_file)
 
 
 class HardcorePlayer:
     """Hardcore mode player - uses separate config directory"""
-    def __init__(self):
+    def __init__(self, paths=None):
         """Get the path to the death marker file based on OS"""
-        if platform.system() == "Windows":
-            base_path = Path(os.getenv('LOCALAPPDATA', os.path.expanduser('~')))
-            config_dir = base_path / '.roulette_hardcore'
-        else:  # Linux, macOS, etc.
-            config_dir = Path.home() / '.config' / 'roulette_hardcore'
+        paths = paths or get_paths()
         
         # Create directory if it doesn't exist
-        config_dir.mkdir(parents=True, exist_ok=True)
-        self.death_file = config_dir / '.death_marker'
+        paths.hardcore_config_dir.mkdir(parents=True, exist_ok=True)
+        self.death_file = paths.hardcore_death_marker
 
 
     def is_dead(self):
@@ -88,13 +93,136 @@ class HardcorePlayer:
 
     def mark_dead(self):
         """Mark player as dead with timestamp"""
-        death_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(self.death_file, 'w') as f:
-            f.write("DEAD\n")
-            f.write(f"{death_time}\n")
+        write_death_marker(self.death_file)
     
     
     def revive(self):
         """Remove death marker - used when consuming a life"""
-        if self.death_file.exists():
-            self.death_file.unlink()
+        remove_death_marker(self.death_file)
+
+
+class PlayerRegistry:
+    """
+    Death state for many players in one SQLite database, keyed by player ID.
+    Reads go through a bounded in-memory cache that every write updates,
+    so repeated is_dead() checks never touch the disk.
+    """
+    def __init__(self, db_path, cache_size=100_000):
+        import sqlite3  # only needed when a registry is in use
+
+        self.db = sqlite3.connect(str(db_path), isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS players ("
+            " player_id TEXT PRIMARY KEY,"
+            " dead INTEGER NOT NULL DEFAULT 0,"
+            " death_time TEXT)"
+        )
+        # Partial index: the bulk "who is dead" query only walks dead players
+        self.db.execute("CREATE INDEX IF NOT EXISTS dead_players ON players (player_id) "
+                        "WHERE dead = 1")
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # player_id -> death time (None if alive)
+
+    def close(self):
+        self.db.close()
+
+    def _remember(self, player_id, death_time):
+        self._cache[player_id] = death_time
+        self._cache.move_to_end(player_id)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _lookup(self, player_id):
+        if player_id in self._cache:
+            self._cache.move_to_end(player_id)
+            return self._cache[player_id]
+        row = self.db.execute("SELECT dead, death_time FROM players WHERE player_id = ?",
+                              (player_id,)).fetchone()
+        death_time = row[1] if row and row[0] else None
+        self._remember(player_id, death_time)
+        return death_time
+
+    def is_dead(self, player_id):
+        return self._lookup(player_id) is not None
+
+    def get_death_time(self, player_id):
+        """Get the timestamp when the player died"""
+        return self._lookup(player_id)
+
+    def mark_dead(self, player_id):
+        """Mark player as dead with timestamp"""
+        self.mark_dead_many([player_id])
+
+    def mark_dead_many(self, player_ids):
+        """Mark several players dead in one transaction"""
+        death_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        player_ids = list(player_ids)
+        with self.db:
+            self.db.execute("BEGIN")
+            self.db.executemany(
+                "INSERT INTO players (player_id, dead, death_time) VALUES (?, 1, ?) "
+                "ON CONFLICT (player_id) DO UPDATE SET dead = 1, death_time = excluded.death_time",
+                ((player_id, death_time) for player_id in player_ids))
+        for player_id in player_ids:
+            self._remember(player_id, death_time)
+
+    def revive(self, player_id):
+        """Clear a player's death state"""
+        self.db.execute("UPDATE players SET dead = 0, death_time = NULL WHERE player_id = ?",
+                        (player_id,))
+        self._remember(player_id, None)
+
+    def dead_players(self):
+        """IDs of every dead player"""
+        return [row[0] for row in self.db.execute(
+            "SELECT player_id FROM players WHERE dead = 1 ORDER BY player_id")]
+
+    def who_is_dead(self, player_ids):
+        """The subset of player_ids that are dead"""
+        player_ids = list(player_ids)
+        dead = set()
+        missing = []
+        for player_id in player_ids:
+            if player_id in self._cache:
+                if self._cache[player_id] is not None:
+                    dead.add(player_id)
+            else:
+                missing.append(player_id)
+        # Look up cache misses in chunks, under SQLite's parameter limit
+        for start in range(0, len(missing), 500):
+            chunk = missing[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            rows = self.db.execute("SELECT player_id, death_time FROM players "
+                                   f"WHERE dead = 1 AND player_id IN ({marks})", chunk)
+            found = dict(rows.fetchall())
+            for player_id in chunk:
+                self._remember(player_id, found.get(player_id))
+            dead.update(found)
+        return dead
+
+    def player(self, player_id):
+        """A Player-like view of one registered player"""
+        return RegisteredPlayer(self, player_id)
+
+
+class RegisteredPlayer:
+    """Player interface backed by a PlayerRegistry, usable by GameSession"""
+    def __init__(self, registry, player_id):
+        self.registry = registry
+        self.player_id = player_id
+
+    def is_dead(self):
+        return self.registry.is_dead(self.player_id)
+
+    def get_death_time(self):
+        """Get the timestamp when player died"""
+        return self.registry.get_death_time(self.player_id)
+
+    def mark_dead(self):
+        """Mark player as dead with timestamp"""
+        self.registry.mark_dead(self.player_id)
+
+    def revive(self):
+        """Clear the death state - used when consuming a life"""
+        self.registry.revive(self.player_id)
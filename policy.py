@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Optimal "Play again?" decisions.
+After every survived round the player can walk away, banking a reward per
+round survived (plus whatever their unused lives are worth), or play on and
+risk a BANG. Dynamic programming over (extra lives, streak) gives the value
+of every state once; after that a hint is a table lookup.
+"""
+
+import random
+import sys
+from array import array
+from functools import lru_cache
+
+from game_session import GameSession, CountedLives
+from rules import NORMAL_RULES
+
+DEFAULT_MAX_LIVES = 10
+DEFAULT_MAX_STREAK = 1000  # beyond this the solver assumes the player stops
+
+
+class Policy:
+    """
+    Value table and stop/continue decisions for one set of rules and payoffs.
+    reward is earned per round survived, death_penalty is paid on permanent
+    death (the streak is lost) and life_value is credited per unused extra
+    life when walking away.
+    """
+    def __init__(self, rules=NORMAL_RULES, reward=1.0, death_penalty=0.0, life_value=0.0,
+                 max_lives=DEFAULT_MAX_LIVES, max_streak=DEFAULT_MAX_STREAK):
+        self.rules = rules
+        self.reward = reward
+        self.death_penalty = death_penalty
+        self.life_value = life_value
+        self.max_lives = max_lives
+        self.max_streak = max_streak
+        # values[lives][streak], go[lives][streak] = 1 if continuing is better
+        self.values = []
+        self.go = []
+        self._solve()
+
+    def stop_value(self, lives, streak):
+        return streak * self.reward + lives * self.life_value
+
+    def _solve(self):
+        p = self.rules.bang_probability
+        q = 1.0 - p
+        top = self.max_streak
+        for lives in range(self.max_lives + 1):
+            values = array('d', bytes(8 * (top + 1)))
+            go = bytearray(top + 1)
+            values[top] = self.stop_value(lives, top)
+            # The streak only grows, so fill each row from the cap downwards
+            for streak in range(top - 1, -1, -1):
+                if lives:
+                    # A BANG burns a life, but the round still counts as survived
+                    bang = self.values[lives - 1][streak + 1]
+                else:
+                    bang = -self.death_penalty
+                play = q * values[streak + 1] + p * bang
+                stop = self.stop_value(lives, streak)
+                if play > stop:
+                    values[streak] = play
+                    go[streak] = 1
+                else:
+                    values[streak] = stop
+            self.values.append(values)
+            self.go.append(go)
+
+    def _clamp(self, lives, streak):
+        if not isinstance(lives, int):
+            lives = self.max_lives  # hardcore: lives are unknown
+        return min(max(lives, 0), self.max_lives), min(max(streak, 0), self.max_streak)
+
+    def should_continue(self, lives, streak):
+        """True if playing another round has the higher expected payoff"""
+        lives, streak = self._clamp(lives, streak)
+        return bool(self.go[lives][streak])
+
+    def value(self, lives, streak):
+        """Expected payoff of the state under optimal play"""
+        lives, streak = self._clamp(lives, streak)
+        return self.values[lives][streak]
+
+    def threshold(self, lives):
+        """First streak at which walking away is optimal"""
+        go = self.go[min(lives, self.max_lives)]
+        for streak in range(self.max_streak + 1):
+            if not go[streak]:
+                return streak
+        return self.max_streak
+
+    def hint(self, lives, streak):
+        if self.should_continue(lives, streak):
+            return "Hint: the odds favour another round."
+        return "Hint: the odds say walk away."
+
+
+@lru_cache(maxsize=32)
+def get_policy(rules=NORMAL_RULES, reward=1.0, death_penalty=0.0, life_value=0.0):
+    """Solved Policy, computed once per ruleset and payoff"""
+    return Policy(rules, reward, death_penalty, life_value)
+
+
+def play_bot(policy, lives=0, rng=None):
+    """Play one session following the policy; returns the payoff"""
+    game = GameSession(CountedLives(lives), rules=policy.rules, rng=rng)
+    while True:
+        game.spin()
+        result = game.pull()
+        if not result.alive:
+            return -policy.death_penalty
+        if not policy.should_continue(game.lives.count_lives(), game.rounds_survived):
+            return policy.stop_value(game.lives.count_lives(), game.rounds_survived)
+        game.continue_()
+
+
+if __name__ == "__main__":
+    lives = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    reward = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    death_penalty = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+    policy = get_policy(NORMAL_RULES, reward, death_penalty)
+
+    for n in range(min(lives, policy.max_lives) + 1):
+        stop = policy.threshold(n)
+        advice = f"walk away at a streak of {stop}" if stop < policy.max_streak else "keep playing"
+        print(f"  {n:>2} extra lives: {advice}")
+    print(f"Expected payoff from the start with {lives} lives: {policy.value(lives, 0):.3f}")
+    rng = random.Random(0)
+    sessions = 20_000
+    mean = sum(play_bot(policy, lives, rng) for _ in range(sessions)) / sessions
+    print(f"Bot following the policy over {sessions:,} sessions: {mean:.3f}")
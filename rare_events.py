@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Importance sampling for rare long-streak probabilities.
+Plain Monte Carlo needs astronomically many sessions to see someone survive
+200 rounds. Here rounds are sampled with a lowered BANG chance and every
+session is reweighted by its likelihood ratio, so the tail converges fast.
+"""
+
+import math
+import random
+import sys
+from typing import NamedTuple
+
+from markov import survival_probability
+from rules import NORMAL_RULES
+
+Z_95 = 1.959963984540054
+
+
+class Estimate(NamedTuple):
+    """Result of an importance-sampling run"""
+    probability: float
+    std_error: float
+    ci_low: float
+    ci_high: float
+    samples: int
+    effective_samples: float
+    proposal: float  # BANG chance used for sampling
+
+
+def default_proposal(lives, rounds, p):
+    """Tilted BANG chance that makes surviving with lives + 1 bangs typical"""
+    return min(p, max((lives + 1.0) / rounds, 1e-9))
+
+
+def estimate_survival(lives, rounds, samples=100_000,
+                      rules=NORMAL_RULES, proposal=None, rng=None):
+    """
+    Estimate P(alive after the given rounds with this many extra lives).
+    Returns an Estimate with a 95% confidence interval and the Kish
+    effective sample size of the importance weights.
+    """
+    rng = rng or random.Random()
+    p = rules.bang_probability
+    q = proposal if proposal is not None else default_proposal(lives, rounds, p)
+
+    log_ratio_bang = math.log(p / q)
+    log_ratio_miss = math.log((1.0 - p) / (1.0 - q))
+    log_miss = math.log(1.0 - q)
+
+    total = total_sq = 0.0
+    for _ in range(samples):
+        played = bangs = 0
+        # Skip straight to the next BANG under the proposal distribution
+        while True:
+            played += int(math.log(1.0 - rng.random()) / log_miss) + 1
+            if played > rounds or bangs == lives:
+                break
+            bangs += 1
+        if played <= rounds:
+            continue  # lives + 1 bangs within the window: dead, weight 0
+        weight = math.exp(bangs * log_ratio_bang + (rounds - bangs) * log_ratio_miss)
+        total += weight
+        total_sq += weight * weight
+
+    mean = total / samples
+    variance = max(total_sq / samples - mean * mean, 0.0)
+    std_error = math.sqrt(variance / samples)
+    ess = (total * total / total_sq) if total_sq else 0.0
+
+    return Estimate(
+        probability=mean,
+        std_error=std_error,
+        ci_low=max(mean - Z_95 * std_error, 0.0),
+        ci_high=min(mean + Z_95 * std_error, 1.0),
+        samples=samples,
+        effective_samples=ess,
+        proposal=q,
+    )
+
+
+if __name__ == "__main__":
+    lives = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    samples = int(sys.argv[3]) if len(sys.argv) > 3 else 100_000
+
+    est = estimate_survival(lives, rounds, samples)
+    print(f"P(survive {rounds} rounds with {lives} extra lives)")
+    print(f"  Estimate:  {est.probability:.6e} +/- {est.std_error:.2e}")
+    print(f"  95% CI:    [{est.ci_low:.6e}, {est.ci_high:.6e}]")
+    print(f"  ESS:       {est.effective_samples:,.0f} of {est.samples:,}")
+    print(f"  Exact:     {survival_probability(lives, rounds):.6e}")
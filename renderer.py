@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Terminal renderer for the cylinder spin animation.
+Frames are fetched from Art as they are drawn, and composed frames and
+diffs are kept in caches no larger than Art's own LRU. Each frame is drawn
+with an ANSI cursor-home + clear sequence in a single buffered write
+(VT processing is switched on for classic Windows consoles),
+instead of spawning a 'clear' subprocess between frames. DiffRenderer goes
+further and only sends the cells that changed since the previous frame.
+"""
+
+import os
+import platform
+import sys
+import time
+from functools import lru_cache
+
+from art_utils import Art
+
+CLEAR = "\x1b[H\x1b[2J"  # cursor home, clear screen
+MOVE = "\x1b[{};{}H"      # move cursor to row, column (1-based)
+ERASE_EOL = "\x1b[K"      # erase from cursor to end of line
+
+# Unchanged gaps shorter than this are resent rather than jumped over,
+# since a cursor move costs about as many bytes
+MIN_GAP = 6
+
+# Timing of the original spin_cylinder animation
+INTRO_DELAY = 1.0
+FRAME_DELAY = 0.08
+SPIN_CYCLES = 6
+FINAL_DELAY = 0.3
+
+
+ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+
+@lru_cache(maxsize=None)
+def _enable_vt(fd):
+    """Turn on ANSI handling for a Windows console (Windows 10+); False if it can't be"""
+    try:
+        import ctypes
+        import msvcrt
+        kernel32 = ctypes.windll.kernel32
+        handle = msvcrt.get_osfhandle(fd)
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        if mode.value & ENABLE_VIRTUAL_TERMINAL_PROCESSING:
+            return True
+        return bool(kernel32.SetConsoleMode(handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+    except (ImportError, AttributeError, OSError):
+        return False
+
+
+def supports_ansi(stream):
+    """Whether the stream is a terminal that understands ANSI escapes"""
+    if not hasattr(stream, "isatty") or not stream.isatty():
+        return False
+    if os.getenv("TERM") == "dumb":
+        return False
+    if platform.system() == "Windows":
+        if os.getenv("WT_SESSION") or os.getenv("ANSICON") or os.getenv("TERM"):
+            return True
+        # Classic conhost: switch on its VT mode, else fall back to plain frames
+        try:
+            return _enable_vt(stream.fileno())
+        except (AttributeError, OSError, ValueError):
+            return False
+    return True
+
+
+def sleep_until(deadline):
+    """Sleep until a perf_counter deadline, absorbing drift from earlier frames"""
+    remaining = deadline - time.perf_counter()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+class FrameRenderer:
+    """Draws composed frames with one write per frame"""
+    def __init__(self, art_dir="./Art/", stream=None, ansi=None):
+        self.art = Art(art_dir)
+        self.animation = list(self.art.animation)
+        self.stream = stream or sys.stdout
+        self.ansi = supports_ansi(self.stream) if ansi is None else ansi
+
+        # Dumb terminals get plain frames, separated by a blank line
+        self.clear = CLEAR if self.ansi else "\n"
+        self.intro = self.clear + "\n You spin the cylinder...\n\n"
+        # Frames come from Art on demand; composed ones are cached no larger than Art's cache
+        self.composed = lru_cache(maxsize=self.art.cache_size)(self._compose)
+
+    def _compose(self, name):
+        return self.clear + self.art.frame(name) + "\n"
+
+    def write(self, text):
+        self.stream.write(text)
+        self.stream.flush()
+
+    def clear_screen(self):
+        self.write(self.clear)
+
+    def spin(self):
+        """Play the spin animation with the original timing"""
+        start = time.perf_counter()
+        self.write(self.intro)
+        deadline = start + INTRO_DELAY
+        sleep_until(deadline)
+
+        for _ in range(SPIN_CYCLES):
+            for name in self.animation:
+                self.write(self.composed(name))
+                deadline += FRAME_DELAY
+                sleep_until(deadline)
+
+        # Final position
+        self.write(self.composed(self.animation[0]))
+        sleep_until(deadline + FINAL_DELAY)
+
+
+def diff_screens(front, back):
+    """
+    Escape sequence that turns the front screen into the back screen.
+    Screens are tuples of row strings; only changed runs of cells are sent.
+    """
+    out = []
+    for row in range(max(len(front), len(back))):
+        old = front[row] if row < len(front) else ""
+        new = back[row] if row < len(back) else ""
+        if old == new:
+            continue
+        width = max(len(old), len(new))
+        old = old.ljust(width)
+        new = new.ljust(width)
+
+        col = 0
+        while col < width:
+            if old[col] == new[col]:
+                col += 1
+                continue
+            if not new[col:].strip():
+                # Nothing left on the new row: erase instead of sending blanks
+                out.append(MOVE.format(row + 1, col + 1) + ERASE_EOL)
+                break
+            # Extend the run until a long enough stretch of unchanged cells
+            start = end = col
+            gap = 0
+            while col < width and gap < MIN_GAP:
+                if old[col] == new[col]:
+                    gap += 1
+                else:
+                    gap = 0
+                    end = col + 1
+                col += 1
+            out.append(MOVE.format(row + 1, start + 1) + new[start:end])
+    return "".join(out)
+
+
+class DiffRenderer(FrameRenderer):
+    """
+    Double-buffered renderer. The front buffer is what is on screen; each
+    draw diffs the next screen against it and emits only the changed runs.
+    Screens and the diffs between named screens sit in bounded LRU caches.
+    """
+    INTRO = "<intro>"  # name of the "You spin the cylinder..." screen
+
+    def __init__(self, art_dir="./Art/", stream=None):
+        super().__init__(art_dir, stream, ansi=True)
+        self.intro_screen = self._screen("\n You spin the cylinder...\n")
+        self.screens = lru_cache(maxsize=self.art.cache_size)(self._frame_screen)
+        self.diffs = lru_cache(maxsize=2 * self.art.cache_size)(self._diff)
+        self.front = None
+        self.front_name = None
+
+    @staticmethod
+    def _screen(text):
+        return tuple(line.rstrip() for line in text.split("\n"))
+
+    def _frame_screen(self, name):
+        return self._screen(self.art.frame(name))
+
+    def screen(self, name):
+        return self.intro_screen if name == self.INTRO else self.screens(name)
+
+    def _diff(self, front_name, name):
+        return diff_screens(self.screen(front_name), self.screen(name))
+
+    def draw(self, screen, name=None):
+        """Make screen the front buffer, writing as little as possible"""
+        if self.front is None:
+            update = CLEAR + "\n".join(screen)
+        elif name is not None and self.front_name is not None:
+            update = self.diffs(self.front_name, name)
+        else:
+            update = diff_screens(self.front, screen)
+        # Park the cursor below the drawing so later prints land there
+        self.write(update + MOVE.format(len(screen) + 1, 1))
+        self.front = screen
+        self.front_name = name
+
+    def draw_named(self, name):
+        self.draw(self.screen(name), name)
+
+    def clear_screen(self):
+        super().clear_screen()
+        self.front = ()
+        self.front_name = None
+
+    def spin(self):
+        """Play the spin animation with the original timing"""
+        # Whatever was printed since the last draw is unknown: start clean
+        self.front = None
+        start = time.perf_counter()
+        self.draw_named(self.INTRO)
+        deadline = start + INTRO_DELAY
+        sleep_until(deadline)
+
+        for _ in range(SPIN_CYCLES):
+            for name in self.animation:
+                self.draw_named(name)
+                deadline += FRAME_DELAY
+                sleep_until(deadline)
+
+        # Final position
+        self.draw_named(self.animation[0])
+        sleep_until(deadline + FINAL_DELAY)
+
+
+@lru_cache(maxsize=None)
+def get_renderer(art_dir="./Art/"):
+    """Renderer for an art directory, built once per process"""
+    if supports_ansi(sys.stdout):
+        return DiffRenderer(art_dir)
+    return FrameRenderer(art_dir)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Game rules as data.
+A Rules tuple (chambers, bullets, jam rate, dud rate, mode) is compiled once
+into alias-method tables, so every pull is a single uniform draw no matter
+how many chambers or outcomes there are. The interactive game, the server,
+the tables and every simulator share the same compiled ruleset.
+"""
+
+import json
+import math
+import sys
+from functools import lru_cache
+from typing import NamedTuple
+
+CHAMBERS = 6
+NORMAL_FAILURE_RATE = 0.33    # play_round: jam or dud on the loaded chamber
+HARDCORE_FAILURE_RATE = 0.13  # play_round_hardcore: same, but rarer
+JAM_SHARE = 0.5               # 50-50 split between gun jam and dud ammo
+
+# What a pull can do before lives are taken into account
+EMPTY = "empty"  # empty chamber
+JAM = "jam"      # loaded chamber, gun jammed
+DUD = "dud"      # loaded chamber, dud round
+BANG = "bang"    # loaded chamber fired
+
+
+class Rules(NamedTuple):
+    """One ruleset; jam and dud rates are chances per loaded-chamber pull"""
+    chambers: int = CHAMBERS
+    bullets: int = 1
+    jam_rate: float = NORMAL_FAILURE_RATE * JAM_SHARE
+    dud_rate: float = NORMAL_FAILURE_RATE * (1 - JAM_SHARE)
+    mode: str = "normal"
+
+    @property
+    def failure_rate(self):
+        """Chance a loaded chamber jams or duds instead of firing"""
+        return self.jam_rate + self.dud_rate
+
+    @property
+    def loaded_probability(self):
+        return self.bullets / self.chambers
+
+    @property
+    def bang_probability(self):
+        """Chance that a single round ends in a BANG"""
+        return self.loaded_probability * (1.0 - self.failure_rate)
+
+    def compile(self):
+        return compile_rules(self)
+
+
+NORMAL_RULES = Rules()
+HARDCORE_RULES = Rules(jam_rate=HARDCORE_FAILURE_RATE * JAM_SHARE,
+                       dud_rate=HARDCORE_FAILURE_RATE * (1 - JAM_SHARE),
+                       mode="hardcore")
+RULESETS = {rules.mode: rules for rules in (NORMAL_RULES, HARDCORE_RULES)}
+
+
+def load_rules(path):
+    """
+    Rules from a JSON file. A "mode" naming a built-in ruleset is used as
+    the base, and any other keys override it. Invalid rules raise
+    ValueError here rather than on first use.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    base = RULESETS.get(data.get("mode"), NORMAL_RULES)
+    unknown = set(data) - set(Rules._fields)
+    if unknown:
+        raise ValueError(f"Unknown rule keys: {', '.join(sorted(unknown))}")
+    rules = base._replace(**data)
+    rules.compile()
+    return rules
+
+
+class AliasTable:
+    """Walker/Vose alias table: O(1) weighted draws from a fixed distribution"""
+    def __init__(self, outcomes, weights):
+        pairs = [(o, w) for o, w in zip(outcomes, weights) if w > 0]
+        if not pairs:
+            raise ValueError("Alias table needs at least one positive weight")
+        total = sum(w for _, w in pairs)
+        n = len(pairs)
+        self.outcomes = [o for o, _ in pairs]
+        self.n = n
+        scaled = [w * n / total for _, w in pairs]
+        self.prob = [1.0] * n
+        alias = list(range(n))
+
+        small = [i for i, s in enumerate(scaled) if s < 1.0]
+        large = [i for i, s in enumerate(scaled) if s >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Leftovers are 1.0 up to rounding error
+        self.aliases = [self.outcomes[i] for i in alias]
+
+    def draw(self, rng):
+        """One outcome from a single uniform: the integer part picks a column,
+        the fraction decides between it and its alias"""
+        x = rng.random() * self.n
+        i = int(x)
+        return self.outcomes[i] if x - i < self.prob[i] else self.aliases[i]
+
+
+class CompiledRules:
+    """Precomputed outcome tables for one Rules"""
+    def __init__(self, rules):
+        if not 1 <= rules.bullets <= rules.chambers:
+            raise ValueError(f"Need 1..{rules.chambers} bullets, got {rules.bullets}")
+        # A failure rate of 1 would mean no BANG ever, so no session could end
+        if rules.jam_rate < 0 or rules.dud_rate < 0 or rules.failure_rate >= 1:
+            raise ValueError("Jam and dud rates must be >= 0 and add up to less than 1")
+        self.rules = rules
+        fire_rate = 1.0 - rules.failure_rate
+
+        # Full pull table: (chamber, outcome); chambers 1..bullets hold the bullets
+        pulls, weights = [], []
+        for chamber in range(1, rules.chambers + 1):
+            if chamber <= rules.bullets:
+                for outcome, rate in ((JAM, rules.jam_rate), (DUD, rules.dud_rate),
+                                      (BANG, fire_rate)):
+                    pulls.append((chamber, outcome))
+                    weights.append(rate)
+            else:
+                pulls.append((chamber, EMPTY))
+                weights.append(1.0)
+        self.pulls = AliasTable(pulls, weights)
+        # What a loaded chamber does, for simulators that skip the empty ones
+        self.loaded = AliasTable((JAM, DUD, BANG), (rules.jam_rate, rules.dud_rate, fire_rate))
+        empty = 1.0 - rules.loaded_probability
+        self.log_empty = math.log(empty) if empty > 0 else -math.inf
+
+    def pull(self, rng):
+        """(chamber, outcome) of one spin-and-pull"""
+        return self.pulls.draw(rng)
+
+    def empty_run(self, rng):
+        """Number of empty chambers hit before the next loaded chamber"""
+        return int(math.log(1.0 - rng.random()) / self.log_empty)
+
+
+@lru_cache(maxsize=None)
+def compile_rules(rules):
+    """The process-wide compiled tables for a ruleset"""
+    return CompiledRules(rules)
+
+
+if __name__ == "__main__":
+    rules = load_rules(sys.argv[1]) if len(sys.argv) > 1 else NORMAL_RULES
+    print(rules)
+    print(f"  P(loaded) = {rules.loaded_probability:.4f}")
+    print(f"  P(BANG)   = {rules.bang_probability:.4f}")
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Multi-session Russian Roulette server.
+Runs one GameSession per TCP connection inside a single asyncio event loop.
+The line protocol is plain text, so netcat works as a client:
+
+    $ nc localhost 6666
+    spin | pull | again | quit | lives | top | help
+"""
+
+import argparse
+import asyncio
+import random
+
+from game_session import (GameSession, CountedLives, SPIN, PULL, CONTINUE, QUIT,
+                          READY, SPUN, FIRED, OVER, EMPTY, JAM, DUD, REVIVED, DEAD)
+from leaderboard import Leaderboard
+from rules import RULESETS, NORMAL_RULES, load_rules
+
+# Same pacing as spin_cylinder and play_round, but non-blocking
+SPIN_DELAY = 1.0 + 12 * 0.08 + 0.3
+TRIGGER_DELAY = 0.5
+RESULT_DELAY = 1.5
+
+COMMANDS = {
+    "spin": SPIN,
+    "pull": PULL,
+    "again": CONTINUE,
+    "y": CONTINUE,
+    "quit": QUIT,
+    "n": QUIT,
+}
+
+HELP = "Commands: spin, pull, again (y), quit (n), lives, top, help"
+
+MESSAGES = {
+    EMPTY: "You survived this round! Chamber {chamber}/{chambers} was empty.",
+    JAM: "*CLUNK* - THE GUN JAMMED! You survive by sheer luck!",
+    DUD: "*THUNK* - DUD ROUND! You survive by sheer luck!",
+    REVIVED: "BANG! You're dead! EXTRA LIFE CONSUMED. Lives remaining: {lives}",
+    DEAD: "BANG! You're dead! Game Over.",
+}
+
+PROMPTS = {
+    READY: "Type 'spin' to spin the cylinder.",
+    SPUN: "Type 'pull' to pull the trigger.",
+    FIRED: "Play again? (y/n)",
+}
+
+
+class RouletteServer:
+    """Hosts many concurrent sessions with per-connection lives and death state"""
+    def __init__(self, lives=1, pace=1.0, rules=NORMAL_RULES, seed=None):
+        self.lives = lives
+        self.pace = pace  # multiplier on the delays, 0 disables pacing
+        self.rules = rules
+        self.seeds = random.Random(seed)
+        self.connections = 0
+        self.players = 0
+        self.leaderboard = Leaderboard()
+        self.server = None
+
+    def new_session(self):
+        rng = random.Random(self.seeds.getrandbits(64))
+        return GameSession(CountedLives(self.lives), rules=self.rules, rng=rng)
+
+    async def _pause(self, seconds):
+        if self.pace:
+            await asyncio.sleep(seconds * self.pace)
+
+    async def _send(self, writer, text):
+        writer.write(text.encode() + b"\n")
+        # Only waits if this client's buffer is full; other sessions keep running
+        await writer.drain()
+
+    def format_leaderboard(self):
+        lines = []
+        for title, entries in (("Longest streaks", self.leaderboard.streaks.snapshot()),
+                               ("Most lives burned", self.leaderboard.lives_burned.snapshot())):
+            lines.append(title + ":")
+            lines.extend(f"  {rank:>2}. {player} - {value}"
+                         for rank, (player, value) in enumerate(entries, 1))
+        return lines
+
+    async def handle_event(self, game, event, player=None):
+        """Apply one event to a session and return the reply lines"""
+        if event == SPIN:
+            result = game.spin()
+            await self._pause(SPIN_DELAY)
+            return [f"Round {result.round}: you spin the cylinder...", PROMPTS[SPUN]]
+
+        if event == PULL:
+            await self._pause(TRIGGER_DELAY)
+            result = game.pull()
+            if player is not None:
+                self.leaderboard.record(player, result)
+            lines = ["*CLICK*", MESSAGES[result.outcome].format(
+                chamber=result.chamber, chambers=game.rules.chambers,
+                lives=result.lives_after)]
+            if result.outcome in (JAM, DUD, REVIVED):
+                await self._pause(RESULT_DELAY)
+            if result.alive:
+                lines.append(PROMPTS[FIRED])
+            return lines
+
+        if event == CONTINUE:
+            game.continue_()
+            return [PROMPTS[READY]]
+
+        result = game.quit()
+        if result.alive:
+            return [f"You walk away alive after {result.rounds_survived} rounds. Wise choice."]
+        return [f"You survived {result.rounds_survived} rounds."]
+
+    async def handle_client(self, reader, writer):
+        game = self.new_session()
+        self.connections += 1
+        self.players += 1
+        player = f"player-{self.players}"
+        try:
+            await self._send(writer, "RUSSIAN ROULETTE - " + HELP)
+            await self._send(writer, PROMPTS[READY])
+            while game.state != OVER:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.decode(errors="replace").strip().lower()
+                if command == "help":
+                    await self._send(writer, HELP)
+                    continue
+                if command == "lives":
+                    await self._send(writer, f"Extra Lives: {game.lives.count_lives()}")
+                    continue
+                if command == "top":
+                    await self._send(writer, "\n".join(self.format_leaderboard()))
+                    continue
+                event = COMMANDS.get(command)
+                if event is None:
+                    await self._send(writer, f"Unknown command: {command!r}. {HELP}")
+                    continue
+                try:
+                    lines = await self.handle_event(game, event, player)
+                except ValueError:
+                    await self._send(writer, PROMPTS.get(game.state, HELP))
+                    continue
+                await self._send(writer, "\n".join(lines))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=6666):
+        self.server = await asyncio.start_server(self.handle_client, host, port,
+                                                 backlog=4096)
+        async with self.server:
+            await self.server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Russian Roulette TCP server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6666)
+    parser.add_argument("--lives", type=int, default=1, help="extra lives per connection")
+    parser.add_argument("--pace", type=float, default=1.0, help="delay multiplier (0 = no delays)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--mode", choices=sorted(RULESETS), default="normal")
+    parser.add_argument("--rules", help="JSON rules file (overrides --mode)")
+    args = parser.parse_args()
+
+    rules = load_rules(args.rules) if args.rules else RULESETS[args.mode]
+    server = RouletteServer(lives=args.lives, pace=args.pace, rules=rules, seed=args.seed)
+    print(f"Russian Roulette server listening on {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Headless simulation of Russian Roulette.
+Reproduces the play_round / play_round_hardcore outcome model without any
+input(), printing or sleeping so millions of rounds can be simulated.
+"""
+
+import math
+import random
+import sys
+import time
+from collections import Counter
+
+from rules import JAM, DUD, NORMAL_RULES
+
+# Rounds are not drawn one at a time. The number of empty chambers before the
+# next loaded one is geometric, so it is drawn directly from a single uniform
+# (inverse CDF). Only ~1 in 6 rounds costs a loop iteration, and what the
+# loaded chamber does is one more draw from the rules' alias table.
+
+
+class RoundStats:
+    """Outcome counts for a batch of independent rounds"""
+    def __init__(self):
+        self.rounds = 0
+        self.empty = 0
+        self.jams = 0
+        self.duds = 0
+        self.bangs = 0
+
+    def merge(self, other):
+        """Add the counts of another RoundStats into this one"""
+        self.rounds += other.rounds
+        self.empty += other.empty
+        self.jams += other.jams
+        self.duds += other.duds
+        self.bangs += other.bangs
+        return self
+
+    def as_dict(self):
+        return {
+            "rounds": self.rounds,
+            "empty": self.empty,
+            "jams": self.jams,
+            "duds": self.duds,
+            "bangs": self.bangs,
+        }
+
+
+class SessionStats:
+    """Per-session histograms for a population of simulated sessions"""
+    def __init__(self):
+        self.sessions = 0
+        self.deaths = 0                  # sessions ending in permanent death
+        self.rounds_survived = Counter() # rounds survived -> sessions
+        self.lives_consumed = Counter()  # lives consumed -> sessions
+        self.jams = Counter()            # jams per session -> sessions
+        self.duds = Counter()            # duds per session -> sessions
+
+    def merge(self, other):
+        """Add the histograms of another SessionStats into this one"""
+        self.sessions += other.sessions
+        self.deaths += other.deaths
+        self.rounds_survived.update(other.rounds_survived)
+        self.lives_consumed.update(other.lives_consumed)
+        self.jams.update(other.jams)
+        self.duds.update(other.duds)
+        return self
+
+    def total_rounds(self):
+        """Total rounds played across all sessions (including fatal ones)"""
+        return sum(k * v for k, v in self.rounds_survived.items()) + self.deaths
+
+    def mean_rounds_survived(self):
+        if not self.sessions:
+            return 0.0
+        return sum(k * v for k, v in self.rounds_survived.items()) / self.sessions
+
+    def __eq__(self, other):
+        if not isinstance(other, SessionStats):
+            return NotImplemented
+        return (self.sessions == other.sessions
+                and self.deaths == other.deaths
+                and self.rounds_survived == other.rounds_survived
+                and self.lives_consumed == other.lives_consumed
+                and self.jams == other.jams
+                and self.duds == other.duds)
+
+
+def simulate_rounds(n, rules=NORMAL_RULES, rng=None):
+    """Simulate n independent rounds and return their outcome counts"""
+    rng = rng or random.Random()
+    compiled = rules.compile()
+    stats = RoundStats()
+    played = 0
+
+    while True:
+        played += compiled.empty_run(rng) + 1
+        if played > n:
+            break
+        # The loaded chamber came up: jam, dud or bang
+        outcome = compiled.loaded.draw(rng)
+        if outcome == JAM:
+            stats.jams += 1
+        elif outcome == DUD:
+            stats.duds += 1
+        else:
+            stats.bangs += 1
+
+    stats.rounds = n
+    stats.empty = n - stats.jams - stats.duds - stats.bangs
+    return stats
+
+
+def simulate_sessions(count, lives=0, rules=NORMAL_RULES, rng=None, max_rounds=None):
+    """
+    Simulate count sessions that keep pulling the trigger until permanent death.
+    Each bang consumes one of the extra lives, like play_round does.
+    If max_rounds is given, a session that reaches it walks away alive.
+    """
+    rng = rng or random.Random()
+    compiled = rules.compile()
+    stats = SessionStats()
+    rand = rng.random
+    log_empty = compiled.log_empty
+    loaded = compiled.loaded.draw
+
+    for _ in range(count):
+        rounds = 0
+        lives_left = lives
+        jams = duds = 0
+        dead = False
+
+        while True:
+            rounds += int(math.log(1.0 - rand()) / log_empty) + 1
+            if max_rounds is not None and rounds > max_rounds:
+                rounds = max_rounds
+                break
+            outcome = loaded(rng)
+            if outcome == JAM:
+                jams += 1
+            elif outcome == DUD:
+                duds += 1
+            elif lives_left > 0:
+                lives_left -= 1
+            else:
+                dead = True
+                break
+
+        stats.sessions += 1
+        if dead:
+            stats.deaths += 1
+            rounds -= 1  # the fatal round was not survived
+        stats.rounds_survived[rounds] += 1
+        stats.lives_consumed[lives - lives_left] += 1
+        stats.jams[jams] += 1
+        stats.duds[duds] += 1
+
+    return stats
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    start = time.perf_counter()
+    result = simulate_rounds(n)
+    elapsed = time.perf_counter() - start
+    print(f"Simulated {n:,} rounds in {elapsed:.2f}s")
+    for key, value in result.as_dict().items():
+        print(f"  {key:>7}: {value:,}")
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Streaming round statistics with bounded memory.
+The aggregator consumes round results one at a time (any iterable or
+generator), keeps only counters, a streak histogram and a log-bucketed
+quantile sketch, and merges cheaply with aggregators from other workers
+or servers.
+"""
+
+import math
+import random
+import sys
+import time
+from collections import Counter
+
+from game_session import GameSession, CountedLives, EMPTY, JAM, DUD, REVIVED, DEAD
+from rules import NORMAL_RULES
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch (DDSketch-style log buckets).
+    Every quantile is within relative_accuracy of the true value, and the
+    bucket count only grows with log(max / min), not with the data size.
+    """
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets = Counter()
+        self.zeros = 0
+        self.count = 0
+
+    def add(self, value, weight=1):
+        if value <= 0:
+            self.zeros += weight
+        else:
+            self.buckets[math.ceil(math.log(value) / self._log_gamma)] += weight
+        self.count += weight
+
+    def merge(self, other):
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        self.buckets.update(other.buckets)
+        self.zeros += other.zeros
+        self.count += other.count
+        return self
+
+    def quantile(self, q):
+        """Approximate q-quantile (0 <= q <= 1), or None if empty"""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+class _SessionState:
+    __slots__ = ("streak", "rounds")
+
+    def __init__(self):
+        self.streak = 0
+        self.rounds = 0
+
+
+class RoundStatsAggregator:
+    """
+    Live statistics over a stream of rounds.
+    Only sessions still in progress are held in memory; a session ends when
+    it dies or when end_session() is called (e.g. the player walked away).
+    """
+    def __init__(self, rules=NORMAL_RULES, relative_accuracy=0.01):
+        self.rules = rules
+        self.outcomes = Counter()
+        self.streaks = Counter()      # rounds survived in a row -> how often
+        self.session_lengths = QuantileSketch(relative_accuracy)
+        self.sessions = 0
+        self.first_time = None
+        self.last_time = None
+        self._active = {}
+
+    def add(self, result, session_id=0, timestamp=None):
+        """Feed one PullResult (or JournalRecord) for a session"""
+        outcome = result.outcome
+        self.outcomes[outcome] += 1
+
+        timestamp = getattr(result, "timestamp", timestamp)
+        if timestamp is None:
+            timestamp = time.time()
+        if self.first_time is None or timestamp < self.first_time:
+            self.first_time = timestamp
+        if self.last_time is None or timestamp > self.last_time:
+            self.last_time = timestamp
+
+        state = self._active.get(session_id)
+        if state is None:
+            state = self._active[session_id] = _SessionState()
+        state.rounds += 1
+
+        if outcome in (REVIVED, DEAD):
+            self.streaks[state.streak] += 1
+            state.streak = 0
+        else:
+            state.streak += 1
+        if outcome == DEAD:
+            self.end_session(session_id)
+
+    def consume(self, stream, sequential=False):
+        """
+        Feed a stream of rounds. Items are (session_id, PullResult) pairs
+        or records that carry their own session_id (JournalRecord).
+        With sequential=True (one player's journal) a session is closed as
+        soon as the next one starts, so memory stays constant.
+        """
+        previous = None
+        for item in stream:
+            if isinstance(item, tuple) and len(item) == 2:
+                session_id, result = item
+            else:
+                session_id, result = item.session_id, item
+            if sequential and session_id != previous:
+                self.end_session(previous)
+                previous = session_id
+            self.add(result, session_id)
+        return self
+
+    def finish(self):
+        """Close every session still in progress"""
+        for session_id in list(self._active):
+            self.end_session(session_id)
+        return self
+
+    def end_session(self, session_id=0):
+        """Close a session (death or walking away) and record its length"""
+        state = self._active.pop(session_id, None)
+        if state is None:
+            return
+        if state.streak:
+            self.streaks[state.streak] += 1  # streak cut short by walking away
+        self.session_lengths.add(state.rounds)
+        self.sessions += 1
+
+    def merge(self, other):
+        """Fold another aggregator's finished sessions and counters into this one"""
+        self.outcomes.update(other.outcomes)
+        self.streaks.update(other.streaks)
+        self.session_lengths.merge(other.session_lengths)
+        self.sessions += other.sessions
+        for attr, pick in (("first_time", min), ("last_time", max)):
+            ours, theirs = getattr(self, attr), getattr(other, attr)
+            if theirs is not None:
+                setattr(self, attr, theirs if ours is None else pick(ours, theirs))
+        return self
+
+    @property
+    def rounds(self):
+        return sum(self.outcomes.values())
+
+    def jam_dud_rate(self):
+        """Observed jam/dud share of loaded-chamber rounds"""
+        loaded = sum(self.outcomes[o] for o in (JAM, DUD, REVIVED, DEAD))
+        return (self.outcomes[JAM] + self.outcomes[DUD]) / loaded if loaded else 0.0
+
+    def lives_per_hour(self):
+        """Extra lives burned per hour of (wall-clock) play"""
+        if self.first_time is None or self.last_time <= self.first_time:
+            return 0.0
+        return self.outcomes[REVIVED] * 3600.0 / (self.last_time - self.first_time)
+
+    def report(self):
+        return {
+            "rounds": self.rounds,
+            "sessions": self.sessions,
+            "outcomes": {o: self.outcomes[o] for o in (EMPTY, JAM, DUD, REVIVED, DEAD)},
+            "jam_dud_rate": self.jam_dud_rate(),
+            "configured_jam_dud_rate": self.rules.failure_rate,
+            "session_length_p50": self.session_lengths.quantile(0.5),
+            "session_length_p90": self.session_lengths.quantile(0.9),
+            "session_length_p99": self.session_lengths.quantile(0.99),
+            "longest_streak": max(self.streaks) if self.streaks else 0,
+            "lives_per_hour": self.lives_per_hour(),
+        }
+
+
+def simulated_rounds(sessions, lives=0, rules=NORMAL_RULES, rng=None):
+    """Generator of (session_id, PullResult) for bot sessions played to death"""
+    rng = rng or random.Random()
+    for session_id in range(sessions):
+        game = GameSession(CountedLives(lives), rules=rules, rng=rng)
+        while True:
+            game.spin()
+            result = game.pull()
+            yield session_id, result
+            if not result.alive:
+                break
+            game.continue_()
+
+
+def journal_stats(journal, rules=NORMAL_RULES):
+    """Aggregate a player's whole RoundJournal in one streaming pass"""
+    return RoundStatsAggregator(rules).consume(journal.read(), sequential=True).finish()
+
+
+if __name__ == "__main__":
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    lives = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    stats = RoundStatsAggregator().consume(simulated_rounds(sessions, lives, rng=random.Random(0)))
+    for key, value in stats.report().items():
+        print(f"  {key:>24}: {value}")
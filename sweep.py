@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+"What if" parameter sweeps over the game rules.
+Every grid cell (a Rules plus a number of extra lives) is simulated with
+sim_lib across a process pool. Results are cached on disk under a hash of
+the cell's parameters, session count and seed, so re-running an
+overlapping sweep only simulates the cells it has not seen before.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from pathlib import Path
+from typing import NamedTuple
+
+from durable_utils import atomic_write
+from rules import JAM_SHARE, Rules
+from sim_lib import simulate_sessions
+
+CACHE_VERSION = 1  # bump when the simulation model changes
+
+
+class Cell(NamedTuple):
+    rules: Rules
+    lives: int
+
+
+class CellResult(NamedTuple):
+    chambers: int
+    bullets: int
+    jam_rate: float
+    dud_rate: float
+    lives: int
+    sessions: int
+    mean_rounds_survived: float
+    mean_lives_consumed: float
+    death_rate: float
+
+
+def grid(chambers=range(5, 13), bullets=range(1, 4),
+         failure_rates=(0.0, 0.1, 0.2, 0.3, 0.4, 0.5), lives=range(0, 11)):
+    """
+    Cells for every combination. A failure rate is the jam-or-dud chance
+    of a loaded chamber, split between jams and duds like the game does.
+    Invalid rules raise ValueError.
+    """
+    cells = []
+    for c, b, rate, n in product(chambers, bullets, failure_rates, lives):
+        if b > c:
+            continue
+        rules = Rules(chambers=c, bullets=b, jam_rate=rate * JAM_SHARE,
+                      dud_rate=rate * (1 - JAM_SHARE), mode="sweep")
+        rules.compile()
+        cells.append(Cell(rules, n))
+    return cells
+
+
+def cell_key(cell, sessions, seed):
+    """Stable hash of everything that determines a cell's result"""
+    params = {"version": CACHE_VERSION, "rules": cell.rules._asdict(), "lives": cell.lives,
+              "sessions": sessions, "seed": seed}
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+
+def _run_cell(args):
+    cell, sessions, key = args
+    # Seeded from the key, so a cell's result does not depend on the grid around it
+    stats = simulate_sessions(sessions, cell.lives, cell.rules,
+                              rng=random.Random(int(key, 16)))
+    consumed = sum(k * v for k, v in stats.lives_consumed.items())
+    return CellResult(cell.rules.chambers, cell.rules.bullets, cell.rules.jam_rate,
+                      cell.rules.dud_rate, cell.lives, stats.sessions,
+                      stats.mean_rounds_survived(), consumed / stats.sessions,
+                      stats.deaths / stats.sessions)
+
+
+class SweepCache:
+    """One JSON file per cell, named by its key"""
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key):
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key):
+        try:
+            return CellResult(**json.loads(self._path(key).read_text()))
+        except (FileNotFoundError, ValueError, TypeError):
+            return None  # missing, or torn by an older crash: recompute
+
+    def put(self, key, result):
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        atomic_write(path, json.dumps(result._asdict()), sync_dir=False)
+
+
+def run_sweep(cells, sessions=10_000, seed=0, cache_dir="./sweep_cache", workers=None):
+    """
+    Results for every cell, in cell order.
+    Returns (results, number of cells that had to be simulated).
+    """
+    if sessions < 1:
+        raise ValueError("Each cell needs at least one session")
+    cache = SweepCache(cache_dir)
+    keys = [cell_key(cell, sessions, seed) for cell in cells]
+    results = [cache.get(key) for key in keys]
+    missing = [i for i, result in enumerate(results) if result is None]
+
+    jobs = [(cells[i], sessions, keys[i]) for i in missing]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) <= 1:
+        computed = map(_run_cell, jobs)
+        for i, result in zip(missing, computed):
+            cache.put(keys[i], result)
+            results[i] = result
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Cache each cell as it lands, so an interrupted sweep keeps its progress
+            for i, result in zip(missing, pool.map(_run_cell, jobs, chunksize=4)):
+                cache.put(keys[i], result)
+                results[i] = result
+    return results, len(missing)
+
+
+def _int_range(text):
+    low, _, high = text.partition("-")
+    return range(int(low), int(high or low) + 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Russian Roulette parameter sweep")
+    parser.add_argument("--chambers", type=_int_range, default=range(5, 13), help="e.g. 5-12")
+    parser.add_argument("--bullets", type=_int_range, default=range(1, 4), help="e.g. 1-3")
+    parser.add_argument("--lives", type=_int_range, default=range(0, 11), help="e.g. 0-10")
+    parser.add_argument("--failure-rates", type=lambda s: [float(x) for x in s.split(",")],
+                        default=[0.0, 0.1, 0.2, 0.3, 0.4, 0.5], help="e.g. 0,0.25,0.5")
+    parser.add_argument("--sessions", type=int, default=10_000, help="sessions per cell")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache", default="./sweep_cache")
+    parser.add_argument("--output", help="write all results to this CSV file")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        cells = grid(args.chambers, args.bullets, args.failure_rates, args.lives)
+        results, computed = run_sweep(cells, args.sessions, args.seed, args.cache, args.workers)
+    except ValueError as e:
+        parser.error(str(e))
+    elapsed = time.perf_counter() - start
+    print(f"{len(cells):,} cells, {computed:,} simulated, "
+          f"{len(cells) - computed:,} from cache, in {elapsed:.2f}s")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(",".join(CellResult._fields) + "\n")
+            for result in results:
+                f.write(",".join(str(value) for value in result) + "\n")
+        print(f"Results written to {args.output}")
+    else:
+        best = max(results, key=lambda r: r.mean_rounds_survived)
+        worst = min(results, key=lambda r: r.mean_rounds_survived)
+        for label, r in (("Longest", best), ("Shortest", worst)):
+            print(f"  {label} sessions: {r.chambers} chambers, {r.bullets} bullets, "
+                  f"{r.jam_rate + r.dud_rate:.0%} jam/dud, {r.lives} lives -> "
+                  f"{r.mean_rounds_survived:.1f} rounds")
+
+
+if __name__ == "__main__":
+    main()
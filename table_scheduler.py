@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Shared-revolver tables multiplexed on one event loop.
+Several players take turns on one revolver per table. Every delay (spin,
+trigger, turn timeout) is a timer on a single hashed timer wheel instead of
+a sleeping thread or task per table, so scheduling cost per turn stays flat
+no matter how many tables are open.
+"""
+
+import asyncio
+import random
+import sys
+import time
+
+from game_session import GameSession, CountedLives, FIRED, DEAD
+from server import SPIN_DELAY, TRIGGER_DELAY, RESULT_DELAY
+from rules import NORMAL_RULES
+
+TURN_TIMEOUT = 30.0  # seconds a player gets before the table pulls for them
+
+
+class Timer:
+    """Handle for a scheduled callback"""
+    __slots__ = ("rounds", "callback", "args", "cancelled")
+
+    def __init__(self, rounds, callback, args):
+        self.rounds = rounds
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel. schedule() and cancel() are O(1); each tick only
+    looks at the timers hashed into the current slot.
+    """
+    def __init__(self, tick=0.01, slots=1024, now=None):
+        self.tick = tick
+        self.slots = [[] for _ in range(slots)]
+        self.position = 0
+        self.last_tick = now if now is not None else time.monotonic()
+        self.pending = 0
+
+    def schedule(self, delay, callback, *args):
+        """Run callback(*args) after delay seconds"""
+        ticks = max(1, int(round(delay / self.tick)))
+        size = len(self.slots)
+        timer = Timer((ticks - 1) // size, callback, args)
+        self.slots[(self.position + ticks) % size].append(timer)
+        self.pending += 1
+        return timer
+
+    def advance(self, now):
+        """Fire every timer that is due by now"""
+        size = len(self.slots)
+        while now - self.last_tick >= self.tick:
+            self.last_tick += self.tick
+            self.position = (self.position + 1) % size
+            slot = self.slots[self.position]
+            if not slot:
+                continue
+            keep = []
+            due = []
+            for timer in slot:
+                if timer.cancelled:
+                    self.pending -= 1
+                elif timer.rounds:
+                    timer.rounds -= 1
+                    keep.append(timer)
+                else:
+                    self.pending -= 1
+                    due.append(timer)
+            self.slots[self.position] = keep
+            for timer in due:
+                timer.callback(*timer.args)
+
+
+class Table:
+    """One revolver shared by several players taking turns"""
+    def __init__(self, table_id, players, lives=0, rules=NORMAL_RULES, rng=None):
+        self.table_id = table_id
+        rng = rng or random.Random()
+        # Each player keeps their own lives and death state; the rng is the table's
+        self.sessions = {
+            player: GameSession(CountedLives(lives), rules=rules, rng=rng)
+            for player in players
+        }
+        self.order = list(players)
+        self.turn = 0
+        self.rounds = 0
+        self.timeout = None
+        self.busy = False  # a spin/pull is in flight
+
+    @property
+    def current_player(self):
+        return self.order[self.turn % len(self.order)]
+
+    @property
+    def finished(self):
+        return len(self.order) <= 1
+
+
+class TableScheduler:
+    """Runs thousands of tables off one timer wheel in one event loop"""
+    def __init__(self, pace=1.0, turn_timeout=TURN_TIMEOUT, tick=0.01, auto_play=False,
+                 on_result=None):
+        self.pace = pace
+        self.turn_timeout = turn_timeout
+        self.auto_play = auto_play  # bots act as soon as their turn starts
+        self.on_result = on_result  # called with (table, player, PullResult)
+        self.wheel = TimerWheel(tick)
+        self.tables = {}
+        self.done = asyncio.Event()
+
+    def add_table(self, table):
+        self.tables[table.table_id] = table
+        self._start_turn(table)
+
+    def act(self, table_id, player):
+        """The current player asks to spin and pull"""
+        table = self.tables.get(table_id)
+        if table is None or table.busy or table.finished or table.current_player != player:
+            return False
+        if table.timeout is not None:
+            table.timeout.cancel()
+            table.timeout = None
+        self._spin(table)
+        return True
+
+    def _start_turn(self, table):
+        if table.finished:
+            self._close(table)
+            return
+        if self.auto_play:
+            self._spin(table)
+        else:
+            table.timeout = self.wheel.schedule(self.turn_timeout, self._timed_out, table)
+
+    def _timed_out(self, table):
+        table.timeout = None
+        self._spin(table)
+
+    def _spin(self, table):
+        table.busy = True
+        game = table.sessions[table.current_player]
+        if game.state == FIRED:
+            game.continue_()
+        game.spin()
+        self.wheel.schedule((SPIN_DELAY + TRIGGER_DELAY) * self.pace, self._pull, table)
+
+    def _pull(self, table):
+        player = table.current_player
+        result = table.sessions[player].pull()
+        table.rounds += 1
+        if self.on_result is not None:
+            self.on_result(table, player, result)
+
+        if result.outcome == DEAD:
+            index = table.turn % len(table.order)
+            del table.order[index]
+            table.turn = index  # the next player slides into this seat
+        else:
+            table.turn += 1
+
+        delay = RESULT_DELAY * self.pace if result.outcome != DEAD else 0.0
+        self.wheel.schedule(delay, self._end_turn, table)
+
+    def _end_turn(self, table):
+        table.busy = False
+        self._start_turn(table)
+
+    def _close(self, table):
+        del self.tables[table.table_id]
+        if not self.tables:
+            self.done.set()
+
+    async def run(self):
+        """Drive the wheel until every table has a single survivor"""
+        loop = asyncio.get_running_loop()
+        self.wheel.last_tick = loop.time()
+        while self.tables:
+            await asyncio.sleep(self.wheel.tick)
+            self.wheel.advance(loop.time())
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    pace = float(sys.argv[2]) if len(sys.argv) > 2 else 0.01
+
+    async def demo():
+        scheduler = TableScheduler(pace=pace, auto_play=True)
+        rng = random.Random(0)
+        for table_id in range(count):
+            scheduler.add_table(Table(table_id, ["p1", "p2", "p3", "p4"], lives=1, rng=rng))
+        start = time.perf_counter()
+        turns = 0
+
+        def count_turn(table, player, result):
+            nonlocal turns
+            turns += 1
+
+        scheduler.on_result = count_turn
+        await scheduler.run()
+        elapsed = time.perf_counter() - start
+        print(f"{count:,} tables finished {turns:,} turns in {elapsed:.2f}s")
+
+    asyncio.run(demo())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Seeded elimination tournaments for huge simulated fields.
+Players are rows in flat arrays (id, extra lives, rounds survived), not
+Player objects with marker files. Each stage splits the field into
+brackets. Every player plays a heat of rounds, and the better half of each
+bracket advances, or fewer if fewer survived. Brackets are played in
+parallel, each with its own seeded stream, so results do not depend on the
+worker count.
+"""
+
+import argparse
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from parallel_sim import chunk_rng
+from rules import JAM, DUD, RULESETS, NORMAL_RULES, load_rules
+
+BRACKET_SIZE = 1024
+HEAT_ROUNDS = 10
+MAX_LIVES = 0xFFFF  # lives are stored as unsigned shorts
+
+
+class StageReport(NamedTuple):
+    stage: int
+    players: int
+    brackets: int
+    deaths: int
+    advanced: int
+
+
+class Field:
+    """Array-backed player state"""
+    def __init__(self, players, lives=0):
+        self.ids = array('I', range(players))
+        self.lives = array('H', [lives]) * players
+        self.rounds = array('I', bytes(4 * players))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def brackets(self, size):
+        for start in range(0, len(self.ids), size):
+            stop = start + size
+            yield self.ids[start:stop], self.lives[start:stop], self.rounds[start:stop]
+
+
+def _play_bracket(args):
+    """Play one bracket's heat; returns (ids, lives, rounds, deaths) of those advancing"""
+    seed, stage, index, ids, lives, rounds, rules, heat_rounds = args
+    rng = chunk_rng(f"{seed}:{stage}", index)
+    compiled = rules.compile()
+    empty_run = compiled.empty_run
+    loaded = compiled.loaded.draw
+
+    ranking = []
+    survivors = 0
+    for row in range(len(ids)):
+        left = lives[row]
+        played = 0
+        alive = True
+        while True:
+            played += empty_run(rng) + 1
+            if played > heat_rounds:
+                played = heat_rounds
+                break
+            outcome = loaded(rng)
+            if outcome == JAM or outcome == DUD:
+                continue
+            if left:
+                left -= 1
+            else:
+                alive = False
+                played -= 1  # the fatal round was not survived
+                break
+        lives[row] = left
+        rounds[row] += played
+        survivors += alive
+        # Survivors first, then longest heat, most lives kept; a seeded coin breaks ties
+        ranking.append((alive, played, left, rng.random(), row))
+
+    # Half the bracket goes through, never a dead player unless all of them died
+    keep = max(1, min((len(ids) + 1) // 2, survivors))
+    kept = sorted(row for *_, row in sorted(ranking, reverse=True)[:keep])
+    return (array('I', (ids[r] for r in kept)), array('H', (lives[r] for r in kept)),
+            array('I', (rounds[r] for r in kept)), len(ids) - survivors)
+
+
+def run_tournament(players, lives=0, seed=0, rules=NORMAL_RULES, heat_rounds=HEAT_ROUNDS,
+                   bracket_size=BRACKET_SIZE, workers=None):
+    """Play stages until one player is left; returns (winner row, [StageReport])"""
+    if players < 1:
+        raise ValueError("A tournament needs at least one player")
+    if bracket_size < 2:
+        raise ValueError("Brackets need at least two players to eliminate anyone")
+    if not 0 <= lives <= MAX_LIVES:
+        raise ValueError(f"Extra lives must be between 0 and {MAX_LIVES}, got {lives}")
+    if heat_rounds < 1:
+        raise ValueError("A heat needs at least one round")
+    field = Field(players, lives)
+    workers = workers or os.cpu_count() or 1
+    reports = []
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        stage = 0
+        while len(field) > 1:
+            stage += 1
+            jobs = [(seed, stage, index, ids, lives_, rounds, rules, heat_rounds)
+                    for index, (ids, lives_, rounds) in enumerate(field.brackets(bracket_size))]
+            results = pool.map(_play_bracket, jobs) if pool else map(_play_bracket, jobs)
+
+            before = len(field)
+            advancing = Field(0)
+            deaths = 0
+            # Brackets are merged in order, so the next stage's brackets are reproducible
+            for ids, lives_, rounds, died in results:
+                advancing.ids.extend(ids)
+                advancing.lives.extend(lives_)
+                advancing.rounds.extend(rounds)
+                deaths += died
+            field = advancing
+            reports.append(StageReport(stage, before, len(jobs), deaths, len(field)))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return (field.ids[0], field.lives[0], field.rounds[0]), reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Russian Roulette elimination tournament")
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--lives", type=int, default=1, help="extra lives per player")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--heat-rounds", type=int, default=HEAT_ROUNDS)
+    parser.add_argument("--bracket-size", type=int, default=BRACKET_SIZE)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--mode", choices=sorted(RULESETS), default="normal")
+    parser.add_argument("--rules", help="JSON rules file (overrides --mode)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        rules = load_rules(args.rules) if args.rules else RULESETS[args.mode]
+        (winner, lives_left, rounds), reports = run_tournament(
+            args.players, args.lives, args.seed, rules, args.heat_rounds,
+            args.bracket_size, args.workers)
+    except ValueError as e:
+        parser.error(str(e))
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.players:,} players, {args.lives} extra lives each, seed {args.seed}")
+    for report in reports:
+        print(f"  Stage {report.stage:>2}: {report.players:>9,} players in {report.brackets:,} "
+              f"brackets, {report.deaths:,} dead, {report.advanced:,} advance")
+    print("=" * 40)
+    print(f"🏆 Winner: player #{winner}")
+    print(f"   Rounds survived: {rounds:,}")
+    print(f"   Extra lives left: {lives_left}")
+    print(f"Finished in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()